@@ -6,7 +6,7 @@ API completa para integração externa com todos os sistemas
 from fastapi import FastAPI, HTTPException, Depends, status, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -27,6 +27,13 @@ from integrated_system_v2 import create_orchestrator, CloudDataOrchestratorV2
 
 logger = get_logger(__name__)
 
+# Respostas grandes (status) via orjson quando disponível
+try:
+    import orjson  # noqa: F401
+    StatusResponse = ORJSONResponse
+except ImportError:
+    StatusResponse = JSONResponse
+
 # Instância global do orquestrador
 orchestrator: Optional[CloudDataOrchestratorV2] = None
 
@@ -164,7 +171,7 @@ async def health_check():
         logger.error(f"Erro no health check: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/status")
+@app.get("/status", response_class=StatusResponse)
 async def get_status(token: str = Depends(verify_token)):
     """Status completo do sistema"""
     try:
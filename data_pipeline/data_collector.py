@@ -4,6 +4,7 @@ import time
 import logging
 import requests
 import boto3
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import Dict, Any, List
 from dotenv import load_dotenv
@@ -27,6 +28,13 @@ class DataCollector:
         self.openweather_api_key = os.environ.get("OPENWEATHER_API_KEY")
         self.cities = ["São Paulo", "Rio de Janeiro", "Brasília"]
 
+        # Sessão HTTP compartilhada: reaproveita conexões keep-alive entre
+        # as chamadas de clima e câmbio em vez de abrir uma por requisição
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def collect_weather_data(self) -> List[Dict[str, Any]]:
         """Coleta dados de clima"""
         weather_data = []
@@ -45,7 +53,7 @@ class DataCollector:
                     "lang": "pt_br",
                 }
 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 response.raise_for_status()
 
                 data = response.json()
@@ -71,7 +79,7 @@ class DataCollector:
         """Coleta dados de câmbio"""
         try:
             url = "https://api.exchangerate-api.com/v4/latest/USD"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -98,20 +106,23 @@ class DataCollector:
             return []
 
     def save_to_dynamodb(self, data: List[Dict[str, Any]], data_type: str) -> None:
-        """Salva dados no DynamoDB"""
+        """Salva dados no DynamoDB em lotes (BatchWriteItem, até 25 itens por requisição)"""
         try:
-            for item in data:
-                item_id = f"{data_type}_{datetime.now().isoformat()}_{hash(str(item))}"
-
-                dynamo_item = {
-                    "id": item_id,
-                    "type": data_type,
-                    "data": item,
-                    "timestamp": datetime.now().isoformat(),
-                    "created_at": datetime.now().isoformat(),
-                }
+            # overwrite_by_pkeys descarta ids repetidos no mesmo lote, que o
+            # BatchWriteItem rejeitaria
+            with self.table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
+                for item in data:
+                    item_id = f"{data_type}_{datetime.now().isoformat()}_{hash(str(item))}"
+
+                    dynamo_item = {
+                        "id": item_id,
+                        "type": data_type,
+                        "data": item,
+                        "timestamp": datetime.now().isoformat(),
+                        "created_at": datetime.now().isoformat(),
+                    }
 
-                self.table.put_item(Item=dynamo_item)
+                    batch.put_item(Item=dynamo_item)
 
             logger.info(f"{len(data)} itens salvos no DynamoDB para tipo {data_type}")
 
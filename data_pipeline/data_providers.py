@@ -76,6 +76,20 @@ class DataRequest:
             ).hexdigest()
 
 
+@dataclass(frozen=True)
+class ProviderSnap:
+    """Snapshot imutável dos contadores de requisições
+    
+    Substituído por inteiro a cada atualização; leitores obtêm a referência uma vez.
+    """
+    __slots__ = ("total", "ok", "fail", "active")
+    
+    total: int
+    ok: int
+    fail: int
+    active: int
+
+
 @dataclass
 class DataResponse:
     """Resposta de dados de um provedor"""
@@ -194,7 +208,9 @@ class FinancialDataProvider(BaseDataProvider):
                     timeout=aiohttp.ClientTimeout(total=self.config.timeout)
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        # Bytes brutos ficam disponíveis para extração em streaming
+                        raw = await response.read()
+                        data = json.loads(raw)
                         
                         # Salvar no cache
                         self.cache.set(cache_key, data, ttl=self.config.cache_ttl)
@@ -206,7 +222,8 @@ class FinancialDataProvider(BaseDataProvider):
                             timestamp=datetime.now(),
                             metadata={
                                 "status_code": response.status,
-                                "source": "api"
+                                "source": "api",
+                                "raw": raw
                             }
                         )
                     else:
@@ -501,6 +518,9 @@ class DataProviderManager:
         # Carregar configurações e inicializar provedores
         self._load_providers()
         
+        # Contadores publicados para leitura sem cópia
+        self.snap = ProviderSnap(0, 0, 0, len(self.providers))
+        
         self.logger.info("Gerenciador de provedores de dados inicializado")
     
     def _load_providers(self):
@@ -607,16 +627,27 @@ class DataProviderManager:
             timestamp=datetime.now()
         )
         self.request_history.append(request)
+        snap = self.snap
+        self.snap = ProviderSnap(snap.total + 1, snap.ok, snap.fail, snap.active)
         
         # Buscar dados
         response = await provider.fetch_data(endpoint, params)
         response.request_id = request.request_id
         self.response_history.append(response)
         
+        snap = self.snap
+        if response.status == "success":
+            self.snap = ProviderSnap(snap.total, snap.ok + 1, snap.fail, snap.active)
+        else:
+            self.snap = ProviderSnap(snap.total, snap.ok, snap.fail + 1, snap.active)
+        
         return response
     
-    async def fetch_multiple_providers(self, requests: List[Dict[str, Any]]) -> List[DataResponse]:
-        """Busca dados de múltiplos provedores em paralelo"""
+    def fetch_multiple_providers_iter(self, requests: List[Dict[str, Any]]) -> List[asyncio.Task]:
+        """Agenda as requisições em paralelo e retorna as tasks
+        
+        Permite consumir as respostas com asyncio.as_completed à medida que chegam.
+        """
         tasks = []
         for req in requests:
             provider_id = req.get("provider")
@@ -624,9 +655,15 @@ class DataProviderManager:
             params = req.get("params")
             
             if provider_id and endpoint:
-                task = self.fetch_data(provider_id, endpoint, params)
+                task = asyncio.create_task(self.fetch_data(provider_id, endpoint, params))
                 tasks.append(task)
         
+        return tasks
+    
+    async def fetch_multiple_providers(self, requests: List[Dict[str, Any]]) -> List[DataResponse]:
+        """Busca dados de múltiplos provedores em paralelo"""
+        tasks = self.fetch_multiple_providers_iter(requests)
+        
         if tasks:
             responses = await asyncio.gather(*tasks, return_exceptions=True)
             # Filtrar exceções
@@ -697,6 +734,14 @@ class DataProviderManager:
             if resp.timestamp > cutoff_date
         ]
         
+        ok = sum(1 for resp in self.response_history if resp.status == "success")
+        self.snap = ProviderSnap(
+            len(self.request_history),
+            ok,
+            len(self.response_history) - ok,
+            len(self.providers)
+        )
+        
         self.logger.info(f"Histórico limpo (mantidos últimos {days} dias)")
 
 
@@ -9,6 +9,7 @@ import sys
 import subprocess
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from pathlib import Path
 
 class DeployManager:
@@ -126,8 +127,9 @@ class DeployManager:
         """Executa verificações de qualidade de código"""
         print("🔍 Executando verificações de qualidade...")
         
-        # Black
-        self.run_command("black --check .", check=False)
+        # Black (metade dos núcleos, já que roda em paralelo com os testes)
+        workers = max(1, (os.cpu_count() or 2) // 2)
+        self.run_command(f"black --check --workers {workers} .", check=False)
         
         # Flake8
         self.run_command("flake8 . --max-line-length=88 --ignore=E203,W503", check=False)
@@ -263,11 +265,15 @@ class DeployManager:
         # Instalar dependências
         self.install_dependencies()
         
-        # Executar testes
-        self.run_tests()
-        
-        # Executar linting
-        self.run_linting()
+        # Executar testes e linting em paralelo (independentes entre si)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.run_tests),
+                executor.submit(self.run_linting)
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.result()
         
         # Deploy da infraestrutura
         if not skip_infrastructure:
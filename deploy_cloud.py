@@ -10,8 +10,11 @@ import subprocess
 import json
 import time
 import requests
+import boto3
+from botocore.exceptions import ClientError
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 import argparse
 
 class CloudDeployManager:
@@ -22,6 +25,7 @@ class CloudDeployManager:
         self.project_name = "clouddataorchestrator"
         self.aws_region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         self.tf_dir = Path("infrastructure")
+        self._s3 = boto3.client("s3", region_name=self.aws_region)
         
         # Configurações por ambiente
         self.config = {
@@ -144,17 +148,28 @@ class CloudDeployManager:
         
         # Criar bucket se não existir
         try:
-            self.run_command(f"aws s3 ls s3://{bucket_name}")
+            self._s3.head_bucket(Bucket=bucket_name)
             print(f"✅ Bucket {bucket_name} já existe")
-        except subprocess.CalledProcessError:
+        except ClientError:
             print(f"📦 Criando bucket {bucket_name}...")
-            self.run_command(f"aws s3 mb s3://{bucket_name} --region {self.aws_region}")
+            create_kwargs = {"Bucket": bucket_name}
+            if self.aws_region != "us-east-1":
+                create_kwargs["CreateBucketConfiguration"] = {"LocationConstraint": self.aws_region}
+            self._s3.create_bucket(**create_kwargs)
             
             # Habilitar versionamento
-            self.run_command(f"aws s3api put-bucket-versioning --bucket {bucket_name} --versioning-configuration Status=Enabled")
+            self._s3.put_bucket_versioning(
+                Bucket=bucket_name,
+                VersioningConfiguration={"Status": "Enabled"}
+            )
             
             # Habilitar criptografia
-            self.run_command(f"""aws s3api put-bucket-encryption --bucket {bucket_name} --server-side-encryption-configuration '{{"Rules":[{{"ApplyServerSideEncryptionByDefault":{{"SSEAlgorithm":"AES256"}}}}]}}'""")
+            self._s3.put_bucket_encryption(
+                Bucket=bucket_name,
+                ServerSideEncryptionConfiguration={
+                    "Rules": [{"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}]
+                }
+            )
         
         return bucket_name
     
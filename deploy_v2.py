@@ -5,13 +5,60 @@ Automatiza o processo de deploy com Docker e verificação de saúde
 """
 
 import os
+import re
 import sys
+import copy
+import asyncio
 import subprocess
+import threading
 import time
 import json
+import logging
+import random
+import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from enum import IntEnum
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+# Padrão de erro procurado nos logs dos containers (linhas em bytes)
+_ERROR_RE = re.compile(rb"error", re.IGNORECASE)
+
+# Logger dos comandos executados (CDO_QUIET=1 suprime as mensagens informativas)
+_log = logging.getLogger("deploy")
+if not _log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _log.addHandler(_handler)
+    _log.propagate = False
+_log.setLevel(logging.WARNING if os.environ.get("CDO_QUIET") == "1" else logging.INFO)
+
+# JSON: orjson quando disponível (mais rápido e serializa datetime nativamente)
+try:
+    import orjson
+    
+    def _jdumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    _jloads = orjson.loads
+except ImportError:
+    def _jdumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+    
+    _jloads = json.loads
+
+
+class HealthState(IntEnum):
+    """Estado de saúde de um componente (começa em 1: nenhum estado é falsy)"""
+    HEALTHY = 1
+    UNHEALTHY = 2
+    UNKNOWN = 3
 
 
 class DeployManager:
@@ -26,11 +73,60 @@ class DeployManager:
             "alerts",
             "ml-service"
         ]
+        self._services_set = frozenset(self.services)
+        
+        # Binários resolvidos uma única vez no PATH
+        self._docker_bin = shutil.which("docker")
+        self._compose_bin = shutil.which("docker-compose")
+        if self._compose_bin:
+            self._compose_cmd = [self._compose_bin]
+        else:
+            # Sem o binário legado, usa o plugin `docker compose` (se estiver instalado)
+            self._compose_bin = self._docker_bin if self._has_compose_plugin() else None
+            self._compose_cmd = [self._docker_bin or "docker", "compose"]
         
         # Configurações de deploy
         self.docker_compose_file = "docker-compose.yml"
         self.env_file = ".env"
+        self.cache_file = ".deploy_cache.json"
+        self.prerequisites_ttl = 3600
+        
+        # Polling do docker-compose: backoff exponencial entre 250 ms e 4 s
+        self.poll_initial_delay = 0.25
+        self.poll_max_delay = 4.0
         self.health_check_url = "http://localhost:8501/_stcore/health"
+        self.docker_socket_url = "unix:///var/run/docker.sock"
+        self.compose_project = os.getenv(
+            "COMPOSE_PROJECT_NAME", os.path.basename(os.getcwd()).lower()
+        )
+        
+        # Thread que grava o relatório do deploy
+        self._report_thread: Optional[threading.Thread] = None
+        
+        # Cliente da Docker Engine API (criado sob demanda)
+        self._docker = None
+        
+        # Sessão HTTP persistente (keep-alive) para os probes de saúde
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Método do probe HTTP (muda para GET se o endpoint recusar HEAD)
+        self._probe_method = "HEAD"
+        
+        # Cache do probe HTTP do dashboard: (timestamp, resultado)
+        self.health_probe_ttl = 30
+        self._dashboard_probe = (0.0, None)
         
         # Status do deploy
         self.deploy_status = {
@@ -38,62 +134,160 @@ class DeployManager:
             "end_time": None,
             "services_status": {},
             "health_checks": {},
+            "health_details": {},
             "errors": []
         }
     
-    def run_command(self, command: str, check: bool = True) -> subprocess.CompletedProcess:
-        """Executa um comando do sistema"""
-        print(f"🔄 Executando: {command}")
+    def run_command(self, argv: List[str], check: bool = True,
+                    on_line: Optional[Callable[[str], Any]] = None,
+                    env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        """Executa um comando do sistema (argv, sem shell)
+        
+        Se ``on_line`` for informado, a saída é processada linha a linha em vez de
+        ser acumulada em memória; se o callback retornar True a leitura é encerrada.
+        Variáveis em ``env`` são somadas ao ambiente atual.
+        """
+        _log.info("🔄 Executando: %s", " ".join(argv))
         
         try:
+            if on_line is not None:
+                return self._run_streaming(argv, check, on_line)
+            
             result = subprocess.run(
-                command,
-                shell=True,
+                argv,
                 check=check,
                 capture_output=True,
-                text=True
+                text=True,
+                env={**os.environ, **env} if env else None
             )
             
             if result.stdout:
-                print(f"✅ Saída: {result.stdout.strip()}")
+                _log.info("✅ Saída: %s", result.stdout.strip())
             
             if result.stderr:
-                print(f"⚠️ Erro: {result.stderr.strip()}")
+                _log.warning("⚠️ Erro: %s", result.stderr.strip())
             
             return result
             
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Erro ao executar comando: {e}")
+        except (subprocess.CalledProcessError, OSError) as e:
+            _log.error("❌ Erro ao executar comando: %s", e)
             if check:
                 raise
-            return e
+            # Com check=False só chega aqui se o binário não puder ser executado
+            return subprocess.CompletedProcess(argv, 127, "", str(e))
+    
+    def _run_streaming(self, argv: List[str], check: bool,
+                       on_line: Callable[[str], Any]) -> subprocess.CompletedProcess:
+        """Executa o comando repassando cada linha de stdout ao callback"""
+        stopped_early = False
+        with subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ) as proc:
+            for line in proc.stdout:
+                if on_line(line.rstrip("\n")):
+                    stopped_early = True
+                    proc.terminate()
+                    break
+            returncode = proc.wait()
+        
+        # Encerrado pelo callback: não é falha do comando
+        if stopped_early:
+            returncode = 0
+        
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, argv)
+        return subprocess.CompletedProcess(argv, returncode)
+    
+    def _has_compose_plugin(self) -> bool:
+        """Verifica uma única vez se o plugin `docker compose` está instalado"""
+        if not self._docker_bin:
+            return False
+        try:
+            result = subprocess.run(
+                [self._docker_bin, "compose", "version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+    
+    def _prerequisites_cache_key(self) -> str:
+        """Chave do cache de pré-requisitos baseada nos mtimes dos binários e arquivos"""
+        paths = [
+            self._docker_bin,
+            self._compose_bin,
+            self.docker_compose_file,
+            "requirements.txt",
+            "docker/Dockerfile"
+        ]
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(str(os.stat(path).st_mtime_ns) if path else "missing")
+            except OSError:
+                mtimes.append("missing")
+        return ":".join(mtimes)
+    
+    def _load_deploy_cache(self) -> Dict[str, Any]:
+        """Carrega o cache local do deploy"""
+        try:
+            with open(self.cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_deploy_cache(self, cache: Dict[str, Any]):
+        """Salva o cache local do deploy"""
+        try:
+            with open(self.cache_file, "w") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"⚠️ Erro ao salvar cache de deploy: {e}")
     
     def check_prerequisites(self) -> bool:
         """Verifica pré-requisitos para o deploy"""
         print("🔍 Verificando pré-requisitos...")
         
+        cache_key = self._prerequisites_cache_key()
+        cache = self._load_deploy_cache()
+        cached = cache.get("prerequisites", {})
+        if cached.get("key") == cache_key and time.time() - cached.get("ts", 0) < self.prerequisites_ttl:
+            print("✅ Pré-requisitos já verificados (cache)")
+            self._ensure_env_file()
+            return True
+        
+        if not self._check_prerequisites_uncached():
+            return False
+        
+        cache["prerequisites"] = {"key": cache_key, "ts": time.time()}
+        self._save_deploy_cache(cache)
+        return True
+    
+    def _ensure_env_file(self):
+        """Cria o arquivo .env de exemplo se não existir"""
+        if not os.path.exists(self.env_file):
+            print(f"⚠️ {self.env_file} não encontrado, criando exemplo...")
+            self.create_env_example()
+    
+    def _check_prerequisites_uncached(self) -> bool:
+        """Executa as verificações de pré-requisitos"""
         # Verificar Docker
-        try:
-            result = self.run_command("docker --version", check=False)
-            if result.returncode == 0:
-                print("✅ Docker encontrado")
-            else:
-                print("❌ Docker não encontrado")
-                return False
-        except Exception as e:
-            print(f"❌ Erro ao verificar Docker: {e}")
+        if self._docker_bin:
+            print("✅ Docker encontrado")
+        else:
+            print("❌ Docker não encontrado")
             return False
         
         # Verificar Docker Compose
-        try:
-            result = self.run_command("docker-compose --version", check=False)
-            if result.returncode == 0:
-                print("✅ Docker Compose encontrado")
-            else:
-                print("❌ Docker Compose não encontrado")
-                return False
-        except Exception as e:
-            print(f"❌ Erro ao verificar Docker Compose: {e}")
+        if self._compose_bin:
+            print("✅ Docker Compose encontrado")
+        else:
+            print("❌ Docker Compose não encontrado")
             return False
         
         # Verificar arquivos necessários
@@ -103,17 +297,26 @@ class DeployManager:
             "docker/Dockerfile"
         ]
         
+        # Uma listagem por diretório em vez de um stat por arquivo
+        entries_by_dir: Dict[str, set] = {}
         for file_path in required_files:
-            if os.path.exists(file_path):
+            directory, name = os.path.split(file_path)
+            directory = directory or "."
+            if directory not in entries_by_dir:
+                try:
+                    with os.scandir(directory) as it:
+                        entries_by_dir[directory] = {entry.name for entry in it}
+                except OSError:
+                    entries_by_dir[directory] = set()
+            
+            if name in entries_by_dir[directory]:
                 print(f"✅ {file_path} encontrado")
             else:
                 print(f"❌ {file_path} não encontrado")
                 return False
         
         # Verificar arquivo .env
-        if not os.path.exists(self.env_file):
-            print(f"⚠️ {self.env_file} não encontrado, criando exemplo...")
-            self.create_env_example()
+        self._ensure_env_file()
         
         print("✅ Todos os pré-requisitos atendidos!")
         return True
@@ -160,13 +363,17 @@ PROVIDERS_ENABLED=true
         
         try:
             # Parar serviços existentes
-            self.run_command("docker-compose down", check=False)
+            self.run_command([*self._compose_cmd, "down"], check=False)
             
-            # Limpar imagens antigas
-            self.run_command("docker system prune -f", check=False)
+            # Limpar imagens antigas (opcional, pode levar minutos)
+            if os.environ.get("CDO_DEPLOY_PRUNE") == "1":
+                self.run_command(["docker", "system", "prune", "-f"], check=False)
             
-            # Construir imagens
-            result = self.run_command("docker-compose build --no-cache")
+            # Construir imagens aproveitando o cache de camadas do BuildKit
+            result = self.run_command(
+                [*self._compose_cmd, "build"],
+                env={"DOCKER_BUILDKIT": "1", "COMPOSE_DOCKER_CLI_BUILD": "1"}
+            )
             
             if result.returncode == 0:
                 print("✅ Imagens construídas com sucesso!")
@@ -185,7 +392,7 @@ PROVIDERS_ENABLED=true
         
         try:
             # Iniciar serviços em background
-            result = self.run_command("docker-compose up -d")
+            result = self.run_command([*self._compose_cmd, "up", "-d"])
             
             if result.returncode == 0:
                 print("✅ Serviços iniciados com sucesso!")
@@ -198,82 +405,254 @@ PROVIDERS_ENABLED=true
             print(f"❌ Erro ao iniciar serviços: {e}")
             return False
     
+    def _get_docker_client(self):
+        """Obtém cliente da Docker Engine API (None se indisponível)"""
+        if self._docker is None:
+            try:
+                import docker
+                client = docker.DockerClient(base_url=self.docker_socket_url)
+                client.ping()
+                self._docker = client
+            except Exception as e:
+                print(f"⚠️ Docker Engine API indisponível, usando docker-compose: {e}")
+                self._docker = False
+        
+        return self._docker or None
+    
+    @staticmethod
+    def _container_ready(container) -> bool:
+        """Verifica se o container está rodando (e saudável, se houver healthcheck)"""
+        state = container.attrs.get("State", {})
+        health = state.get("Health")
+        if not state.get("Running"):
+            return False
+        return health is None or health.get("Status") == "healthy"
+    
+    @staticmethod
+    def _parse_compose_ps(output) -> List[Dict[str, Any]]:
+        """Interpreta a saída de `docker-compose ps --format json`
+        
+        Versões antigas do Compose emitem um array JSON; as atuais, um objeto por linha.
+        """
+        output = output.strip()
+        if not output:
+            return []
+        if output[:1] in ("[", b"["):
+            return _jloads(output)
+        return [_jloads(line) for line in output.splitlines() if line.strip()]
+    
+    def _wait_for_services_events(self, client, timeout: int) -> bool:
+        """Aguarda os serviços via snapshot + stream de eventos da Docker Engine API"""
+        label = f"com.docker.compose.project={self.compose_project}"
+        pending = set(self._services_set)
+        since = int(time.time())
+        deadline = since + timeout
+        
+        # Snapshot inicial dos containers do projeto
+        for container in client.containers.list(filters={"label": label}):
+            service = container.labels.get("com.docker.compose.service")
+            if service in pending and self._container_ready(container):
+                pending.discard(service)
+                print(f"✅ {service} pronto")
+        
+        if not pending:
+            print("✅ Todos os serviços estão rodando!")
+            return True
+        
+        # Stream de eventos (encerra sozinho ao atingir o deadline)
+        events = client.events(
+            decode=True,
+            since=since,
+            until=deadline,
+            filters={"type": "container", "label": label}
+        )
+        try:
+            for event in events:
+                attributes = event.get("Actor", {}).get("Attributes", {})
+                service = attributes.get("com.docker.compose.service")
+                if service not in pending:
+                    continue
+                
+                action = event.get("Action", "")
+                if action != "start" and not action.startswith("health_status"):
+                    continue
+                
+                container = client.containers.get(event.get("id"))
+                if self._container_ready(container):
+                    pending.discard(service)
+                    print(f"✅ {service} pronto")
+                
+                if not pending:
+                    print("✅ Todos os serviços estão rodando!")
+                    return True
+        finally:
+            events.close()
+        
+        print(f"❌ Timeout aguardando serviços: {', '.join(sorted(pending))}")
+        return False
+    
     def wait_for_services(self, timeout: int = 120) -> bool:
         """Aguarda os serviços ficarem prontos"""
         print(f"⏳ Aguardando serviços ficarem prontos (timeout: {timeout}s)...")
         
+        client = self._get_docker_client()
+        if client is not None:
+            try:
+                return self._wait_for_services_events(client, timeout)
+            except Exception as e:
+                print(f"⚠️ Erro na Docker Engine API, usando docker-compose: {e}")
+        
         start_time = time.time()
+        delay = self.poll_initial_delay
         
         while time.time() - start_time < timeout:
             try:
                 # Verificar status dos containers
-                result = self.run_command("docker-compose ps", check=False)
+                result = self.run_command(
+                    [*self._compose_cmd, "ps", "--format", "json"], check=False
+                )
                 
                 if result.returncode == 0:
                     # Verificar se todos os serviços estão rodando
-                    if all(service in result.stdout for service in self.services):
+                    running = {
+                        container.get("Service")
+                        for container in self._parse_compose_ps(result.stdout)
+                        if container.get("State") == "running"
+                    }
+                    if self._services_set <= running:
                         print("✅ Todos os serviços estão rodando!")
                         return True
                 
                 print("⏳ Aguardando serviços...")
-                time.sleep(10)
                 
             except Exception as e:
                 print(f"⚠️ Erro ao verificar status: {e}")
-                time.sleep(10)
+            
+            # Backoff exponencial com jitter de ±20%
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.poll_max_delay)
         
         print("❌ Timeout aguardando serviços")
         return False
     
-    def health_check(self) -> Dict[str, Any]:
-        """Executa verificações de saúde dos serviços"""
-        print("🏥 Executando verificações de saúde...")
-        
-        health_results = {}
+    def _probe_dashboard(self) -> Tuple[HealthState, str]:
+        """Probe HTTP do dashboard (memoizado por health_probe_ttl segundos)"""
+        cached_at, cached = self._dashboard_probe
+        if cached is not None and time.monotonic() - cached_at < self.health_probe_ttl:
+            return cached
         
-        # Verificar dashboard
         try:
-            response = requests.get(self.health_check_url, timeout=10)
+            # HEAD evita transferir o corpo; se o endpoint não aceitar (405),
+            # passa a usar GET nas próximas verificações
+            response = self._session.request(
+                self._probe_method, self.health_check_url,
+                timeout=(1, 2), allow_redirects=False
+            )
+            if response.status_code == 405 and self._probe_method == "HEAD":
+                self._probe_method = "GET"
+                response = self._session.get(
+                    self.health_check_url, timeout=(1, 2), allow_redirects=False
+                )
+            
             if response.status_code == 200:
-                health_results["dashboard"] = "healthy"
-                print("✅ Dashboard: Saudável")
+                result = (HealthState.HEALTHY, "healthy")
             else:
-                health_results["dashboard"] = f"unhealthy (HTTP {response.status_code})"
-                print(f"❌ Dashboard: Não saudável (HTTP {response.status_code})")
+                result = (HealthState.UNHEALTHY, f"unhealthy (HTTP {response.status_code})")
         except Exception as e:
-            health_results["dashboard"] = f"unhealthy (Error: {e})"
-            print(f"❌ Dashboard: Erro de conexão - {e}")
+            result = (HealthState.UNHEALTHY, f"unhealthy (Error: {e})")
         
-        # Verificar containers
-        try:
-            result = self.run_command("docker-compose ps --format json", check=False)
-            if result.returncode == 0:
-                containers = json.loads(result.stdout)
-                for container in containers:
-                    service_name = container.get("Service", "unknown")
-                    status = container.get("State", "unknown")
-                    health_results[f"container_{service_name}"] = status
-                    print(f"📦 {service_name}: {status}")
-        except Exception as e:
-            print(f"⚠️ Erro ao verificar containers: {e}")
+        self._dashboard_probe = (time.monotonic(), result)
+        return result
+    
+    async def _check_dashboard(self) -> Tuple[HealthState, str]:
+        """Verifica o dashboard sem bloquear o event loop"""
+        return await asyncio.to_thread(self._probe_dashboard)
+    
+    async def _check_containers(self) -> List[Dict[str, Any]]:
+        """Obtém o estado dos containers via docker-compose ps"""
+        proc = await asyncio.create_subprocess_exec(
+            *self._compose_cmd, "ps", "--format", "json",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0:
+            return []
+        return self._parse_compose_ps(stdout)
+    
+    async def _check_logs(self) -> str:
+        """Procura erros nos logs, parando na primeira ocorrência"""
+        proc = await asyncio.create_subprocess_exec(
+            *self._compose_cmd, "logs", "--tail=10",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        found = False
+        async for line in proc.stdout:
+            if _ERROR_RE.search(line):
+                found = True
+                break
         
-        # Verificar logs de erro
-        try:
-            result = self.run_command("docker-compose logs --tail=10", check=False)
-            if result.returncode == 0:
-                if "ERROR" in result.stdout or "error" in result.stdout:
-                    print("⚠️ Encontrados erros nos logs")
-                    health_results["logs"] = "warnings_found"
-                else:
-                    print("✅ Logs sem erros críticos")
-                    health_results["logs"] = "clean"
-        except Exception as e:
-            print(f"⚠️ Erro ao verificar logs: {e}")
-            health_results["logs"] = f"error: {e}"
+        if found and proc.returncode is None:
+            try:
+                proc.terminate()
+            except ProcessLookupError:
+                pass
+        await proc.wait()
+        return "warnings_found" if found else "clean"
+    
+    async def health_check_async(self) -> Dict[str, Any]:
+        """Executa as verificações de saúde em paralelo"""
+        dashboard, containers, logs = await asyncio.gather(
+            self._check_dashboard(),
+            self._check_containers(),
+            self._check_logs(),
+            return_exceptions=True
+        )
+        
+        health_results = {}
+        health_details = {}
+        
+        # Dashboard
+        if isinstance(dashboard, Exception):
+            dashboard = (HealthState.UNKNOWN, f"unknown (Error: {dashboard})")
+        health_results["dashboard"], health_details["dashboard"] = dashboard
+        if health_results["dashboard"] == HealthState.HEALTHY:
+            print("✅ Dashboard: Saudável")
+        else:
+            print(f"❌ Dashboard: {health_details['dashboard']}")
+        
+        # Containers
+        if isinstance(containers, Exception):
+            print(f"⚠️ Erro ao verificar containers: {containers}")
+        else:
+            for container in containers:
+                service_name = container.get("Service", "unknown")
+                status = container.get("State", "unknown")
+                health_results[f"container_{service_name}"] = status
+                print(f"📦 {service_name}: {status}")
         
-        self.deploy_status["health_checks"] = health_results
+        # Logs
+        if isinstance(logs, Exception):
+            print(f"⚠️ Erro ao verificar logs: {logs}")
+            health_results["logs"] = f"error: {logs}"
+        else:
+            health_results["logs"] = logs
+            if logs == "warnings_found":
+                print("⚠️ Encontrados erros nos logs")
+            else:
+                print("✅ Logs sem erros críticos")
+        
+        # No relatório o dashboard segue como texto ("healthy", "unhealthy (HTTP 500)"...)
+        self.deploy_status["health_checks"] = {**health_results, "dashboard": health_details["dashboard"]}
+        self.deploy_status["health_details"] = health_details
         return health_results
     
+    def health_check(self) -> Dict[str, Any]:
+        """Executa verificações de saúde dos serviços"""
+        print("🏥 Executando verificações de saúde...")
+        return asyncio.run(self.health_check_async())
+    
     def deploy(self) -> bool:
         """Executa o deploy completo"""
         print(f"🚀 Iniciando deploy do {self.project_name} v{self.version}")
@@ -306,7 +685,7 @@ PROVIDERS_ENABLED=true
             health_results = self.health_check()
             
             # 6. Verificar se o deploy foi bem-sucedido
-            dashboard_healthy = health_results.get("dashboard", "").startswith("healthy")
+            dashboard_healthy = health_results.get("dashboard") == HealthState.HEALTHY
             
             if dashboard_healthy:
                 print("🎉 Deploy concluído com sucesso!")
@@ -327,17 +706,34 @@ PROVIDERS_ENABLED=true
             return False
     
     def _save_deploy_report(self):
-        """Salva relatório do deploy"""
+        """Salva relatório do deploy em segundo plano
+        
+        A thread não é daemon, então o interpretador aguarda a escrita antes de sair.
+        """
+        report = {
+            "project": self.project_name,
+            "version": self.version,
+            "deploy_status": copy.deepcopy(self.deploy_status),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        self._report_thread = threading.Thread(
+            target=self._write_deploy_report,
+            args=(report,),
+            name="deploy-report",
+            daemon=False
+        )
+        self._report_thread.start()
+    
+    def _write_deploy_report(self, report: Dict[str, Any]):
+        """Serializa e grava o relatório do deploy"""
         try:
-            report = {
-                "project": self.project_name,
-                "version": self.version,
-                "deploy_status": self.deploy_status,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            with open("deploy_report.json", "w") as f:
-                json.dump(report, f, indent=2, default=str)
+            # Escrita atômica: um único write no temporário + rename
+            payload = _jdumps(report).encode("utf-8")
+            tmp_path = "deploy_report.json.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, "deploy_report.json")
             
             print("📊 Relatório de deploy salvo em deploy_report.json")
             
@@ -350,7 +746,7 @@ PROVIDERS_ENABLED=true
         print("-" * 40)
         
         try:
-            result = self.run_command("docker-compose ps", check=False)
+            result = self.run_command([*self._compose_cmd, "ps"], check=False)
             if result.returncode == 0:
                 print(result.stdout)
             else:
@@ -362,16 +758,14 @@ PROVIDERS_ENABLED=true
         """Mostra logs dos serviços"""
         if service:
             print(f"📋 Logs do serviço {service}:")
-            command = f"docker-compose logs --tail={lines} {service}"
+            argv = [*self._compose_cmd, "logs", f"--tail={lines}", service]
         else:
             print(f"📋 Logs de todos os serviços (últimas {lines} linhas):")
-            command = f"docker-compose logs --tail={lines}"
+            argv = [*self._compose_cmd, "logs", f"--tail={lines}"]
         
         try:
-            result = self.run_command(command, check=False)
-            if result.returncode == 0:
-                print(result.stdout)
-            else:
+            result = self.run_command(argv, check=False, on_line=print)
+            if result.returncode != 0:
                 print("❌ Erro ao obter logs")
         except Exception as e:
             print(f"❌ Erro: {e}")
@@ -381,7 +775,7 @@ PROVIDERS_ENABLED=true
         print("🛑 Parando serviços...")
         
         try:
-            result = self.run_command("docker-compose down")
+            result = self.run_command([*self._compose_cmd, "down"])
             if result.returncode == 0:
                 print("✅ Serviços parados com sucesso!")
             else:
@@ -424,6 +818,8 @@ def main():
         health_results = deploy_manager.health_check()
         print("🏥 Resultados da verificação de saúde:")
         for service, status in health_results.items():
+            if isinstance(status, HealthState):
+                status = status.name.lower()
             print(f"  {service}: {status}")
     
     else:
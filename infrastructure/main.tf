@@ -115,7 +115,10 @@ resource "aws_iam_role_policy" "lambda_policy" {
           "dynamodb:Scan",
           "dynamodb:Query"
         ]
-        Resource = aws_dynamodb_table.data_pipeline_table.arn
+        Resource = [
+          aws_dynamodb_table.data_pipeline_table.arn,
+          "${aws_dynamodb_table.data_pipeline_table.arn}/index/*"
+        ]
       },
       {
         Effect = "Allow"
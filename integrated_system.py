@@ -13,13 +13,9 @@ from typing import Dict, Any, List
 # Adicionar diretório raiz ao path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from config.settings import ConfigManager
-from utils.logger import LogManager, log_execution_time
-from utils.metrics import MetricsCollector, HealthChecker
-from utils.cache import PersistentCache, CacheDecorator
-from utils.validator import DataValidator, DataQualityChecker
-from utils.resilience import ResilienceManager, RetryStrategy
-from data_pipeline.data_collector_enhanced import EnhancedDataCollector
+# Apenas o decorator de logging é necessário na definição da classe; os demais
+# componentes são importados sob demanda para reduzir o tempo de import
+from utils.logger import log_execution_time
 
 class IntegratedSystem:
     """Sistema integrado com todos os componentes"""
@@ -27,6 +23,13 @@ class IntegratedSystem:
     def __init__(self):
         print("🚀 Inicializando Sistema Integrado Cloud Data Orchestrator...")
         
+        from config.settings import ConfigManager
+        from utils.logger import LogManager
+        from utils.metrics import MetricsCollector, HealthChecker
+        from utils.cache import PersistentCache
+        from utils.validator import DataValidator, DataQualityChecker
+        from utils.resilience import ResilienceManager
+        
         # Inicializar sistemas básicos
         self.config_manager = ConfigManager()
         self.log_manager = LogManager(
@@ -40,6 +43,10 @@ class IntegratedSystem:
         self.metrics_collector = MetricsCollector()
         self.health_checker = HealthChecker(self.metrics_collector)
         
+        # Cache do resultado de saúde: (timestamp monotônico, resultado)
+        self.health_cache_ttl = 30
+        self._health_cache = (0.0, None)
+        
         # Inicializar cache
         self.cache = PersistentCache(cache_dir="cache", max_size=1000, default_ttl=3600)
         
@@ -51,16 +58,26 @@ class IntegratedSystem:
         self.resilience_manager = ResilienceManager()
         self._setup_resilience()
         
-        # Inicializar data collector
-        self.data_collector = EnhancedDataCollector()
+        # Data collector é criado no primeiro uso (dependências pesadas)
+        self._data_collector = None
         
         # Configurar health checks
         self._setup_health_checks()
         
         self.logger.info("Sistema integrado inicializado com sucesso")
     
+    @property
+    def data_collector(self):
+        """Data collector, importado e instanciado no primeiro uso"""
+        if self._data_collector is None:
+            from data_pipeline.data_collector_enhanced import EnhancedDataCollector
+            self._data_collector = EnhancedDataCollector()
+        return self._data_collector
+    
     def _setup_resilience(self):
         """Configura componentes de resiliência"""
+        from utils.resilience import RetryStrategy
+        
         # Circuit breaker para APIs externas
         self.resilience_manager.create_circuit_breaker(
             name="external_api",
@@ -109,12 +126,24 @@ class IntegratedSystem:
         self.health_checker.register_health_check("config", check_config)
         self.health_checker.register_health_check("metrics", check_metrics)
     
+    def _cached_health(self) -> Dict[str, Any]:
+        """Obtém a saúde do sistema, reutilizando o resultado por health_cache_ttl segundos"""
+        cached_at, cached = self._health_cache
+        now = time.monotonic()
+        if cached is not None and now - cached_at < self.health_cache_ttl:
+            return cached
+        
+        health = self.health_checker.get_system_health()
+        self._health_cache = (now, health)
+        return health
+    
     @log_execution_time
     def run_data_collection_pipeline(self) -> Dict[str, Any]:
         """Executa pipeline completo de coleta de dados"""
         self.logger.info("🔄 Iniciando pipeline de coleta de dados")
         
         pipeline_start = time.time()
+        timestamp = datetime.now().isoformat()
         
         try:
             # Coletar dados com resiliência
@@ -142,7 +171,7 @@ class IntegratedSystem:
                 "success": True,
                 "duration": pipeline_duration,
                 "data": validated_data,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
         except Exception as e:
@@ -156,7 +185,7 @@ class IntegratedSystem:
                 "success": False,
                 "duration": pipeline_duration,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     def _validate_collected_data(self, collection_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -165,6 +194,7 @@ class IntegratedSystem:
         
         validated_data = {}
         validation_summary = {}
+        counter_batch = {}
         
         for data_type, data_info in collection_result.items():
             if "error" in data_info:
@@ -177,12 +207,19 @@ class IntegratedSystem:
                 summary = self.validator.get_validation_summary(validation_results)
                 
                 # Filtrar apenas dados válidos
-                valid_data = []
-                for i, result in enumerate(validation_results):
-                    if result.is_valid:
-                        valid_data.append(result.validated_data)
-                    else:
-                        self.logger.warning(f"Dados inválidos em {data_type}[{i}]: {result.errors}")
+                valid_data = [r.validated_data for r in validation_results if r.is_valid]
+                total_items = len(validation_results)
+                invalid_items = total_items - len(valid_data)
+                
+                if invalid_items:
+                    # Registrar no máximo os 5 primeiros itens inválidos
+                    invalid = [
+                        (i, r.errors) for i, r in enumerate(validation_results) if not r.is_valid
+                    ][:5]
+                    self.logger.warning(
+                        "Dados inválidos em %s (%d de %d): %s",
+                        data_type, invalid_items, total_items, invalid
+                    )
                 
                 validated_data[data_type] = {
                     "count": len(valid_data),
@@ -192,10 +229,14 @@ class IntegratedSystem:
                 
                 validation_summary[data_type] = summary
                 
-                # Registrar métricas de validação
-                self.metrics_collector.record_counter(f"validation.{data_type}.total", summary["total_items"])
-                self.metrics_collector.record_counter(f"validation.{data_type}.valid", summary["valid_items"])
-                self.metrics_collector.record_counter(f"validation.{data_type}.invalid", summary["invalid_items"])
+                # Acumular métricas de validação
+                counter_batch[f"validation.{data_type}.total"] = total_items
+                counter_batch[f"validation.{data_type}.valid"] = len(valid_data)
+                counter_batch[f"validation.{data_type}.invalid"] = invalid_items
+        
+        # Registrar métricas de validação em lote
+        if counter_batch:
+            self.metrics_collector.record_counters(counter_batch)
         
         self.logger.info(f"✅ Validação concluída: {len(validated_data)} tipos de dados processados")
         return validated_data
@@ -203,10 +244,10 @@ class IntegratedSystem:
     def _cache_collected_data(self, validated_data: Dict[str, Any]) -> None:
         """Armazena dados validados em cache"""
         try:
-            # Armazenar dados por tipo
+            # Armazenar dados por tipo (chave com o minuto atual, calculado uma vez)
+            key_prefix = f"data_{int(time.time() // 60)}"
             for data_type, data_info in validated_data.items():
-                cache_key = f"data_{data_type}_{datetime.now().strftime('%Y%m%d_%H%M')}"
-                self.cache.set(cache_key, data_info, ttl=7200)  # 2 horas
+                self.cache.set(f"{key_prefix}_{data_type}", data_info, ttl=7200)  # 2 horas
             
             # Armazenar dados consolidados
             self.cache.set("last_collected_data", validated_data, ttl=3600)  # 1 hora
@@ -220,7 +261,7 @@ class IntegratedSystem:
         """Retorna status completo do sistema"""
         return {
             "timestamp": datetime.now().isoformat(),
-            "health": self.health_checker.get_system_health(),
+            "health": self._cached_health(),
             "metrics": self.metrics_collector.export_metrics("json"),
             "cache_stats": self.cache.get_stats(),
             "resilience_status": self.resilience_manager.get_status(),
@@ -235,12 +276,14 @@ class IntegratedSystem:
         """Executa verificação de saúde do sistema"""
         self.logger.info("🏥 Executando verificação de saúde do sistema")
         
-        health_status = self.health_checker.get_system_health()
+        health_status = self._cached_health()
         
         # Registrar métricas de saúde
-        self.metrics_collector.record_counter("health_check.total", health_status["summary"]["total"])
-        self.metrics_collector.record_counter("health_check.healthy", health_status["summary"]["healthy"])
-        self.metrics_collector.record_counter("health_check.unhealthy", health_status["summary"]["error"])
+        self.metrics_collector.record_counters({
+            "health_check.total": health_status["summary"]["total"],
+            "health_check.healthy": health_status["summary"]["healthy"],
+            "health_check.unhealthy": health_status["summary"]["error"]
+        })
         
         return health_status
     
@@ -4,12 +4,27 @@ Integra todas as funcionalidades: alertas, ML, provedores de dados e dashboard
 """
 
 import asyncio
+import ctypes
 import time
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
+import io
 import json
+import logging
 import os
+import signal
+from array import array
+from collections import deque
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from utils.logger import get_logger
 from utils.metrics import MetricsCollector
@@ -18,10 +33,36 @@ from utils.validator import DataValidator
 from utils.resilience import CircuitBreaker, RetryHandler
 from utils.alerts import create_alert_manager, AlertManager
 from utils.anomaly_detector import create_anomaly_detector, AnomalyDetector
-from data_pipeline.data_providers import create_data_provider_manager, DataProviderManager
+from utils.fast_numeric import prepare_values
+from data_pipeline.data_providers import create_data_provider_manager, DataProviderManager, ProviderSnap
 
 logger = get_logger(__name__)
 
+# Campos constantes do status do sistema
+_BASE_STATUS = MappingProxyType({"version": "2.0.0"})
+
+# Requisições padrão do pipeline (sobrescritas por config["providers_spec"])
+_DEFAULT_PROVIDERS_SPEC = (
+    {"provider": "alpha_vantage", "endpoint": "TIME_SERIES_DAILY", "params": {"symbol": "AAPL"}},
+    {"provider": "openweather", "endpoint": "weather", "params": {"q": "São Paulo,BR"}},
+    {"provider": "newsapi", "endpoint": "top-headlines", "params": {"country": "br"}}
+)
+
+# Esquemas conhecidos: provedor -> (objeto da série, campo numérico de cada item)
+_NUMERIC_SCHEMAS = MappingProxyType({
+    "Alpha Vantage": ("Time Series (Daily)", "4. close")
+})
+
+
+class StatKey(IntEnum):
+    """Índices dos contadores de estatísticas do sistema"""
+    ALERTS_TRIGGERED = 0
+    ANOMALIES_DETECTED = 1
+
+
+# Contadores de requisições quando não há gerenciador de provedores
+_EMPTY_PROVIDER_SNAP = ProviderSnap(0, 0, 0, 0)
+
 
 class CloudDataOrchestratorV2:
     """Sistema integrado principal da versão 2.0"""
@@ -29,6 +70,7 @@ class CloudDataOrchestratorV2:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.logger = get_logger(__name__)
+        self._sighup_installed = False
         
         # Componentes principais
         self.metrics = MetricsCollector()
@@ -39,27 +81,39 @@ class CloudDataOrchestratorV2:
         self.alert_manager: Optional[AlertManager] = None
         self.anomaly_detector: Optional[AnomalyDetector] = None
         self.data_provider_manager: Optional[DataProviderManager] = None
+        self._pipeline_requests: tuple = ()
         
         # Estado do sistema
         self.is_running = False
         self.start_time = None
+        self._start_mono_ns: Optional[int] = None
+        self._start_iso: Optional[str] = None
+        self._uptime_str = (-1, None)
+        
+        # Último health check (reaproveitado dentro de health_ttl)
+        self._health_cache: Optional[Dict[str, Any]] = None
+        self._health_cache_exp = 0.0
         self.health_status = "healthy"
         
-        # Threads de monitoramento
-        self.monitoring_thread = None
-        self.alert_thread = None
-        self.ml_thread = None
-        
-        # Estatísticas
-        self.stats = {
-            "start_time": None,
-            "total_requests": 0,
-            "successful_requests": 0,
-            "failed_requests": 0,
-            "alerts_triggered": 0,
-            "anomalies_detected": 0,
-            "data_providers_active": 0
-        }
+        # Tasks de monitoramento (rodam no mesmo event loop do loop principal)
+        self._tasks: List[asyncio.Task] = []
+        
+        # Filas de eventos de métricas (uma por consumidor, criadas no event loop)
+        self._metric_queues: Dict[str, asyncio.Queue] = {}
+        
+        # Sinal de parada (criado em start(), dentro do event loop)
+        self._shutdown: Optional[asyncio.Event] = None
+        
+        # Gravações no cache feitas em lote por uma task de fundo
+        self._cache_queue: Optional[asyncio.Queue] = None
+        # Respostas de provedores ainda em processamento (podem enfileirar gravações)
+        self._response_tasks: set = set()
+        
+        # Parâmetros lidos da configuração (recarregados via SIGHUP)
+        self._refresh_config()
+        
+        # Estatísticas (vetor contíguo de contadores indexado por StatKey)
+        self._stat_vec = (ctypes.c_uint64 * len(StatKey))()
         
         self.logger.info("CloudDataOrchestrator v2.0 inicializando...")
     
@@ -81,6 +135,7 @@ class CloudDataOrchestratorV2:
             # Inicializar gerenciador de provedores
             if self.config.get("providers_enabled", True):
                 self.data_provider_manager = create_data_provider_manager(self.config)
+                self._pipeline_requests = self._build_pipeline_requests()
                 self.logger.info("✅ Gerenciador de provedores inicializado")
             
             # Verificar saúde dos componentes
@@ -108,11 +163,21 @@ class CloudDataOrchestratorV2:
                 raise Exception("Falha na inicialização")
             
             self.is_running = True
+            self._shutdown = asyncio.Event()
             self.start_time = datetime.now()
-            self.stats["start_time"] = self.start_time
+            self._start_mono_ns = time.monotonic_ns()
+            self._start_iso = self.start_time.isoformat()
             
-            # Iniciar threads de monitoramento
-            self._start_monitoring_threads()
+            # Recarregar parâmetros da configuração com SIGHUP (indisponível no Windows)
+            if hasattr(signal, "SIGHUP"):
+                try:
+                    asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self._refresh_config)
+                    self._sighup_installed = True
+                except (NotImplementedError, RuntimeError):
+                    pass
+            
+            # Iniciar tasks de monitoramento
+            self._start_monitoring_tasks()
             
             # Loop principal
             await self._main_loop()
@@ -127,92 +192,173 @@ class CloudDataOrchestratorV2:
         self.logger.info("🛑 Parando CloudDataOrchestrator v2.0...")
         
         self.is_running = False
+        if self._shutdown is not None:
+            self._shutdown.set()
+        
+        if self._sighup_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._sighup_installed = False
         
-        # Parar threads de monitoramento
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=5)
+        # Acordar consumidores bloqueados nas filas de métricas
+        self._publish_metrics(None)
         
-        if self.alert_thread and self.alert_thread.is_alive():
-            self.alert_thread.join(timeout=5)
+        # Respostas em processamento terminam antes do fim do writer do cache; a partir
+        # daqui novas gravações vão direto ao cache, e o sentinela nunca descarta itens
+        if self._response_tasks:
+            await asyncio.gather(*self._response_tasks, return_exceptions=True)
+        cache_queue, self._cache_queue = self._cache_queue, None
+        if cache_queue is not None:
+            await cache_queue.put(None)
         
-        if self.ml_thread and self.ml_thread.is_alive():
-            self.ml_thread.join(timeout=5)
+        # Aguardar tasks de monitoramento (canceladas se não terminarem em 30s)
+        if self._tasks:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*self._tasks, return_exceptions=True),
+                    timeout=30
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._tasks = []
+            self._metric_queues = {}
+            self._cache_queue = None
         
         self.logger.info("✅ Sistema parado com sucesso")
     
-    def _start_monitoring_threads(self):
-        """Inicia threads de monitoramento em background"""
-        # Thread de monitoramento geral
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_worker,
-            daemon=True
-        )
-        self.monitoring_thread.start()
+    def _refresh_config(self):
+        """Copia para atributos os parâmetros usados nos loops
+
+        Reaplicado via SIGHUP depois de alterações em self.config.
+        """
+        self._cpu_thr = self.config.get("alert_cpu_threshold", 80)
+        self._mem_thr = self.config.get("alert_memory_threshold", 85)
+        self._err_thr = self.config.get("alert_error_rate_threshold", 5)
+        self._metrics_interval = self.config.get("metrics_interval", 60)
+        self._main_cycle_interval = self.config.get("main_cycle_interval", 300)
+        self._health_ttl = self.config.get("health_ttl", 5)
+    
+    def _start_monitoring_tasks(self):
+        """Inicia tasks de monitoramento em background"""
+        # Task de monitoramento geral
+        self._tasks = [asyncio.create_task(self._monitoring_worker())]
         
-        # Thread de verificação de alertas
+        # Task de gravação em lote no cache
+        self._cache_queue = asyncio.Queue(maxsize=1024)
+        self._tasks.append(asyncio.create_task(self._cache_writer()))
+        
+        # Task de verificação de alertas
         if self.alert_manager:
-            self.alert_thread = threading.Thread(
-                target=self._alert_worker,
-                daemon=True
-            )
-            self.alert_thread.start()
+            self._metric_queues["alerts"] = asyncio.Queue(maxsize=256)
+            self._tasks.append(asyncio.create_task(self._alert_worker()))
         
-        # Thread de detecção de anomalias
+        # Task de detecção de anomalias
         if self.anomaly_detector:
-            self.ml_thread = threading.Thread(
-                target=self._ml_worker,
-                daemon=True
-            )
-            self.ml_thread.start()
+            self._metric_queues["ml"] = asyncio.Queue(maxsize=256)
+            self._tasks.append(asyncio.create_task(self._ml_worker()))
         
-        self.logger.info("Threads de monitoramento iniciados")
+        self.logger.info("Tasks de monitoramento iniciadas")
     
-    def _monitoring_worker(self):
+    async def _wait_shutdown(self, timeout: float) -> bool:
+        """Aguarda até timeout segundos; retorna True se o sistema foi parado"""
+        try:
+            await asyncio.wait_for(self._shutdown.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def _publish_metrics(self, system_metrics: Optional[Dict[str, Any]]):
+        """Publica uma amostra de métricas para os consumidores (None encerra)
+        
+        Com a fila cheia, a amostra mais antiga é descartada.
+        """
+        for queue in self._metric_queues.values():
+            self._put_dropping_oldest(queue, system_metrics)
+    
+    @staticmethod
+    def _put_dropping_oldest(queue: asyncio.Queue, item: Any) -> bool:
+        """Enfileira sem bloquear, descartando o item mais antigo se a fila estiver cheia
+        
+        Retorna True quando algum item foi descartado.
+        """
+        dropped = queue.full()
+        if dropped:
+            queue.get_nowait()
+        queue.put_nowait(item)
+        return dropped
+    
+    async def _monitoring_worker(self):
         """Worker para monitoramento contínuo"""
         while self.is_running:
             try:
                 # Coletar métricas do sistema
                 system_metrics = self.metrics.get_system_metrics()
                 pipeline_metrics = self.metrics.get_pipeline_metrics()
-                cache_metrics = self.metrics.get_cache_metrics()
                 
                 # Verificar saúde do sistema
-                self._check_system_health(system_metrics)
+                self._check_system_health(system_metrics, pipeline_metrics)
                 
-                # Atualizar estatísticas
-                self._update_stats()
+                # Notificar workers de alertas e ML
+                self._publish_metrics(system_metrics)
                 
                 # Aguardar próximo ciclo
-                time.sleep(self.config.get("metrics_interval", 60))
+                if await self._wait_shutdown(self._metrics_interval):
+                    return
                 
             except Exception as e:
-                self.logger.error(f"Erro no worker de monitoramento: {e}")
-                time.sleep(10)
+                self.logger.error("Erro no worker de monitoramento: %s", e)
+                if await self._wait_shutdown(10):
+                    return
     
-    def _alert_worker(self):
+    async def _cache_writer(self):
+        """Worker que grava no cache em lotes de até 64 itens (None encerra)"""
+        queue = self._cache_queue
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            while len(batch) < 64 and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            try:
+                await asyncio.to_thread(self.cache.set_many, batch)
+            except Exception as e:
+                self.logger.error("Erro no worker de cache: %s", e)
+    
+    async def _alert_worker(self):
         """Worker para verificação de alertas"""
+        queue = self._metric_queues["alerts"]
         while self.is_running and self.alert_manager:
             try:
+                # Aguardar nova amostra de métricas
+                if await queue.get() is None:
+                    break
+                
                 # Verificar alertas
                 triggered_alerts = self.alert_manager.check_alerts()
                 
                 if triggered_alerts:
-                    self.logger.info(f"🚨 {len(triggered_alerts)} alertas disparados")
-                    self.stats["alerts_triggered"] += len(triggered_alerts)
-                
-                # Aguardar próximo ciclo
-                time.sleep(self.config.get("alert_check_interval", 30))
+                    self.logger.info("🚨 %d alertas disparados", len(triggered_alerts))
+                    self.stat_inc(StatKey.ALERTS_TRIGGERED, len(triggered_alerts))
                 
             except Exception as e:
-                self.logger.error(f"Erro no worker de alertas: {e}")
-                time.sleep(10)
+                self.logger.error("Erro no worker de alertas: %s", e)
     
-    def _ml_worker(self):
+    async def _ml_worker(self):
         """Worker para detecção de anomalias"""
+        queue = self._metric_queues["ml"]
         while self.is_running and self.anomaly_detector:
             try:
-                # Obter métricas para análise
-                system_metrics = self.metrics.get_system_metrics()
+                # Aguardar nova amostra de métricas
+                system_metrics = await queue.get()
+                if system_metrics is None:
+                    break
                 
                 # Detectar anomalias em métricas principais
                 metrics_to_check = [
@@ -222,62 +368,67 @@ class CloudDataOrchestratorV2:
                 ]
                 
                 for metric_name, values in metrics_to_check:
-                    if values and values[0] is not None:
+                    if not values or values[0] is None:
+                        continue
+                    
+                    values = prepare_values(values)
+                    if values.size:
                         anomalies = self.anomaly_detector.detect_anomalies(metric_name, values)
                         if anomalies:
-                            self.logger.info(f"🔍 {len(anomalies)} anomalias detectadas em {metric_name}")
-                            self.stats["anomalies_detected"] += len(anomalies)
-                
-                # Aguardar próximo ciclo
-                time.sleep(self.config.get("ml_check_interval", 120))
+                            self.logger.info("🔍 %d anomalias detectadas em %s", len(anomalies), metric_name)
+                            self.stat_inc(StatKey.ANOMALIES_DETECTED, len(anomalies))
                 
             except Exception as e:
-                self.logger.error(f"Erro no worker de ML: {e}")
-                time.sleep(10)
+                self.logger.error("Erro no worker de ML: %s", e)
     
-    def _check_system_health(self, system_metrics: Dict[str, Any]):
+    def _check_system_health(self, system_metrics: Dict[str, Any], pipeline_metrics: Dict[str, Any]):
         """Verifica a saúde do sistema baseado nas métricas"""
         try:
             # Verificar CPU
             cpu_percent = system_metrics.get("cpu_percent", 0)
-            if cpu_percent > self.config.get("alert_cpu_threshold", 80):
+            if cpu_percent > self._cpu_thr:
                 self.health_status = "warning"
-                self.logger.warning(f"CPU alto: {cpu_percent}%")
+                self.logger.warning("CPU alto: %s%%", cpu_percent)
             
             # Verificar memória
             memory_percent = system_metrics.get("memory_percent", 0)
-            if memory_percent > self.config.get("alert_memory_threshold", 85):
+            if memory_percent > self._mem_thr:
                 self.health_status = "warning"
-                self.logger.warning(f"Memória alta: {memory_percent}%")
+                self.logger.warning("Memória alta: %s%%", memory_percent)
             
             # Verificar pipeline
-            pipeline_metrics = self.metrics.get_pipeline_metrics()
             error_rate = pipeline_metrics.get("error_rate", 0)
-            if error_rate > self.config.get("alert_error_rate_threshold", 5):
+            if error_rate > self._err_thr:
                 self.health_status = "warning"
-                self.logger.warning(f"Taxa de erro alta: {error_rate}%")
+                self.logger.warning("Taxa de erro alta: %s%%", error_rate)
             
             # Se tudo estiver OK, marcar como saudável
             if self.health_status != "error":
                 self.health_status = "healthy"
                 
         except Exception as e:
-            self.logger.error(f"Erro ao verificar saúde do sistema: {e}")
+            self.logger.error("Erro ao verificar saúde do sistema: %s", e)
             self.health_status = "error"
     
-    def _update_stats(self):
-        """Atualiza estatísticas do sistema"""
-        try:
-            # Atualizar contadores de requisições
-            if self.data_provider_manager:
-                provider_stats = self.data_provider_manager.get_request_stats()
-                self.stats["total_requests"] = provider_stats.get("total_requests", 0)
-                self.stats["successful_requests"] = provider_stats.get("successful_requests", 0)
-                self.stats["failed_requests"] = provider_stats.get("failed_requests", 0)
-                self.stats["data_providers_active"] = len(self.data_provider_manager.providers)
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao atualizar estatísticas: {e}")
+    def stat_inc(self, key: StatKey, n: int = 1):
+        """Incrementa um contador de estatísticas"""
+        self._stat_vec[key] += n
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Estatísticas do sistema como dicionário (montado sob demanda)"""
+        # Contadores de requisições vêm direto do snapshot publicado pelo gerenciador
+        snap = self.data_provider_manager.snap if self.data_provider_manager else _EMPTY_PROVIDER_SNAP
+        stat_vec = self._stat_vec
+        return {
+            "start_time": self.start_time,
+            "total_requests": snap.total,
+            "successful_requests": snap.ok,
+            "failed_requests": snap.fail,
+            "alerts_triggered": stat_vec[StatKey.ALERTS_TRIGGERED],
+            "anomalies_detected": stat_vec[StatKey.ANOMALIES_DETECTED],
+            "data_providers_active": snap.active
+        }
     
     async def _main_loop(self):
         """Loop principal do sistema"""
@@ -292,11 +443,13 @@ class CloudDataOrchestratorV2:
                 await self._maintenance()
                 
                 # Aguardar próximo ciclo
-                await asyncio.sleep(self.config.get("main_cycle_interval", 300))
+                if await self._wait_shutdown(self._main_cycle_interval):
+                    return
                 
             except Exception as e:
                 self.logger.error(f"Erro no loop principal: {e}")
-                await asyncio.sleep(60)
+                if await self._wait_shutdown(60):
+                    return
     
     async def _execute_data_pipeline(self):
         """Executa o pipeline de dados"""
@@ -305,175 +458,229 @@ class CloudDataOrchestratorV2:
             
             if self.data_provider_manager:
                 # Executar coleta de dados de múltiplos provedores
-                requests = [
-                    {"provider": "alpha_vantage", "endpoint": "TIME_SERIES_DAILY", "params": {"symbol": "AAPL"}},
-                    {"provider": "openweather", "endpoint": "weather", "params": {"q": "São Paulo,BR"}},
-                    {"provider": "newsapi", "endpoint": "top-headlines", "params": {"country": "br"}}
-                ]
+                tasks = self.data_provider_manager.fetch_multiple_providers_iter(self._pipeline_requests)
                 
-                responses = await self.data_provider_manager.fetch_multiple_providers(requests)
+                # Processar cada resposta assim que chegar (sobrepõe CPU e rede)
+                processing = []
+                for next_response in asyncio.as_completed(tasks):
+                    try:
+                        response = await next_response
+                    except Exception as e:
+                        self.logger.error("Erro em requisição paralela: %s", e)
+                        continue
+                    task = asyncio.create_task(self._process_response(response))
+                    self._response_tasks.add(task)
+                    task.add_done_callback(self._response_tasks.discard)
+                    processing.append(task)
                 
-                # Processar respostas
-                for response in responses:
-                    if response.status == "success":
-                        # Validar dados
-                        if self.validator.validate_data(response.data):
-                            # Salvar no cache
-                            cache_key = f"provider_data_{response.provider}_{response.timestamp.isoformat()}"
-                            self.cache.set(cache_key, response.data, ttl=3600)
-                            
-                            # Detectar anomalias se habilitado
-                            if self.anomaly_detector and response.data:
-                                # Extrair valores numéricos para análise
-                                numeric_values = self._extract_numeric_values(response.data)
-                                if numeric_values:
-                                    anomalies = self.anomaly_detector.detect_anomalies(
-                                        f"provider.{response.provider}", 
-                                        numeric_values
-                                    )
-                                    if anomalies:
-                                        self.logger.info(f"🔍 {len(anomalies)} anomalias detectadas em dados de {response.provider}")
-                        
-                        self.stats["successful_requests"] += 1
-                    else:
-                        self.stats["failed_requests"] += 1
-                        self.logger.error(f"Erro na requisição para {response.provider}: {response.error_message}")
+                if processing:
+                    await asyncio.gather(*processing)
             
             self.logger.info("✅ Pipeline de dados executado com sucesso")
             
         except Exception as e:
-            self.logger.error(f"Erro ao executar pipeline de dados: {e}")
+            self.logger.error("Erro ao executar pipeline de dados: %s", e)
+    
+    def _build_pipeline_requests(self) -> tuple:
+        """Monta uma única vez as requisições do pipeline a partir da configuração"""
+        spec = self.config.get("providers_spec", _DEFAULT_PROVIDERS_SPEC)
+        return tuple(
+            MappingProxyType({
+                "provider": req["provider"],
+                "endpoint": req["endpoint"],
+                "params": dict(req.get("params") or {})
+            })
+            for req in spec
+        )
     
-    def _extract_numeric_values(self, data: Any) -> List[float]:
-        """Extrai valores numéricos de dados para análise de anomalias"""
-        numeric_values = []
+    async def _process_response(self, response):
+        """Valida, armazena em cache e analisa uma resposta de provedor"""
+        # Bytes brutos não ficam retidos no histórico de respostas
+        raw = response.metadata.pop("raw", None)
         
         try:
-            if isinstance(data, dict):
-                for value in data.values():
-                    if isinstance(value, (int, float)):
-                        numeric_values.append(float(value))
-                    elif isinstance(value, dict):
-                        numeric_values.extend(self._extract_numeric_values(value))
-                    elif isinstance(value, list):
-                        numeric_values.extend(self._extract_numeric_values(value))
-            
-            elif isinstance(data, list):
-                for item in data:
-                    numeric_values.extend(self._extract_numeric_values(item))
-            
-            elif isinstance(data, (int, float)):
-                numeric_values.append(float(data))
+            if response.status == "success":
+                # Validar dados
+                if self.validator.validate_data(response.data):
+                    # Salvar no cache
+                    cache_key = "provider_data_%s_%s" % (response.provider, response.timestamp.isoformat())
+                    if self._cache_queue is not None:
+                        if self._put_dropping_oldest(self._cache_queue, (cache_key, response.data, 3600)):
+                            self.logger.warning("Fila de gravação do cache cheia, item mais antigo descartado")
+                    else:
+                        self.cache.set(cache_key, response.data, ttl=3600)
+                    
+                    # Detectar anomalias se habilitado
+                    if self.anomaly_detector and response.data:
+                        # Extrair valores numéricos para análise
+                        numeric_values = None
+                        if raw is not None:
+                            numeric_values = self._extract_numeric_values_streaming(raw, response.provider)
+                        if numeric_values is None:
+                            numeric_values = self._extract_numeric_values(response.data)
+                        numeric_values = prepare_values(numeric_values)
+                        if numeric_values.size:
+                            anomalies = self.anomaly_detector.detect_anomalies(
+                                f"provider.{response.provider}", 
+                                numeric_values
+                            )
+                            if anomalies:
+                                self.logger.info("🔍 %d anomalias detectadas em dados de %s", len(anomalies), response.provider)
+            else:
+                self.logger.error("Erro na requisição para %s: %s", response.provider, response.error_message)
+        except Exception as e:
+            self.logger.error("Erro ao processar resposta de %s: %s", response.provider, e)
+    
+    def _extract_numeric_values_streaming(self, raw_bytes: bytes, provider: str) -> Optional[np.ndarray]:
+        """Extrai a série numérica direto do JSON bruto para esquemas conhecidos
+        
+        Retorna None quando o provedor não tem esquema conhecido (ou sem ijson),
+        para o chamador usar a extração recursiva.
+        """
+        schema = _NUMERIC_SCHEMAS.get(provider)
+        if schema is None or not IJSON_AVAILABLE:
+            return None
+        
+        series_key, field = schema
+        try:
+            values = array("d", (
+                float(item[field])
+                for _, item in ijson.kvitems(io.BytesIO(raw_bytes), series_key)
+                if field in item
+            ))
+        except Exception as e:
+            self.logger.error("Erro na extração em streaming de %s: %s", provider, e)
+            return None
+        
+        if not values:
+            return np.empty(0, dtype=np.float64)
+        return np.frombuffer(values, dtype=np.float64)
+    
+    def _extract_numeric_values(self, data: Any, max_depth: int = 64) -> np.ndarray:
+        """Extrai valores numéricos de dados para análise de anomalias
+        
+        Percorre a estrutura iterativamente (sem recursão), na mesma ordem de
+        profundidade dos dados, e devolve um ndarray float64 contíguo.
+        Contêineres além de max_depth níveis são ignorados.
+        """
+        # Buffer pré-alocado com crescimento geométrico
+        buf = array("d", bytes(8 * 1024))
+        n = 0
+        
+        try:
+            stack = deque([(data, 0)])
+            while stack:
+                obj, depth = stack.pop()
+                if isinstance(obj, (dict, list)):
+                    if depth >= max_depth:
+                        continue
+                    children = obj.values() if isinstance(obj, dict) else obj
+                    stack.extend((child, depth + 1) for child in reversed(list(children)))
+                elif isinstance(obj, (int, float)):
+                    if n == len(buf):
+                        buf.frombytes(bytes(8 * n))
+                    buf[n] = obj
+                    n += 1
                 
         except Exception as e:
-            self.logger.error(f"Erro ao extrair valores numéricos: {e}")
+            self.logger.error("Erro ao extrair valores numéricos: %s", e)
         
-        return numeric_values
+        if not n:
+            return np.empty(0, dtype=np.float64)
+        return np.frombuffer(buf, dtype=np.float64, count=n)
     
     async def _maintenance(self):
         """Executa tarefas de manutenção"""
         try:
             self.logger.info("🔧 Executando manutenção...")
             
-            # Limpar cache antigo
-            self.cache.cleanup()
+            # Limpezas em memória rodam no próprio loop: as listas e o cache são
+            # alterados pelas corrotinas, e nenhuma delas faz I/O
+            try:
+                expired = self.cache.cleanup(persist=False)
+            except Exception as e:
+                expired = 0
+                self.logger.error(f"Erro na limpeza de cache: {e}")
             
-            # Limpar logs antigos
-            self._cleanup_old_logs()
+            cleanups = []
             
             # Limpar dados antigos de alertas e anomalias
             if self.alert_manager:
-                self.alert_manager.cleanup_old_alerts(days=7)
+                cleanups.append(("alerts", lambda: self.alert_manager.cleanup_old_alerts(days=7)))
             
             if self.anomaly_detector:
-                self.anomaly_detector.cleanup_old_anomalies(days=7)
+                cleanups.append(("anomalies", lambda: self.anomaly_detector.cleanup_old_anomalies(days=7)))
             
             # Limpar dados antigos de provedores
             if self.data_provider_manager:
-                self.data_provider_manager.cleanup_old_data(days=7)
+                cleanups.append(("providers", lambda: self.data_provider_manager.cleanup_old_data(days=7)))
+            
+            for name, cleanup in cleanups:
+                try:
+                    cleanup()
+                except Exception as e:
+                    self.logger.error(f"Erro na limpeza de {name}: {e}")
+            
+            # Só o I/O de disco vai para threads: varredura de logs e gravação do cache
+            disk_work = {"logs": self._cleanup_old_logs()}
+            if expired:
+                disk_work["cache"] = asyncio.to_thread(self.cache.save)
+            
+            results = await asyncio.gather(*disk_work.values(), return_exceptions=True)
+            for name, result in zip(disk_work, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Erro na limpeza de {name}: {result}")
             
             self.logger.info("✅ Manutenção concluída")
             
         except Exception as e:
             self.logger.error(f"Erro na manutenção: {e}")
     
-    def _cleanup_old_logs(self):
+    async def _cleanup_old_logs(self):
+        """Remove logs antigos sem bloquear o event loop"""
+        await asyncio.to_thread(self._cleanup_old_logs_sync)
+    
+    def _cleanup_old_logs_sync(self):
         """Remove logs antigos"""
         try:
             logs_dir = "logs"
-            if not os.path.exists(logs_dir):
-                return
-            
-            cutoff_date = datetime.now() - timedelta(days=7)
-            
-            for filename in os.listdir(logs_dir):
-                file_path = os.path.join(logs_dir, filename)
-                if os.path.isfile(file_path):
-                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    if file_time < cutoff_date:
-                        os.remove(file_path)
-                        self.logger.info(f"Log antigo removido: {filename}")
+            cutoff_ts = (datetime.now() - timedelta(days=7)).timestamp()
+            
+            # DirEntry reaproveita o tipo do readdir e faz um único stat por arquivo
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    # Um arquivo rotacionado/removido durante a varredura não interrompe as demais
+                    try:
+                        if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff_ts:
+                            os.remove(entry.path)
+                            self.logger.info(f"Log antigo removido: {entry.name}")
+                    except FileNotFoundError:
+                        continue
                         
+        except FileNotFoundError:
+            # Diretório de logs inexistente
+            return
         except Exception as e:
             self.logger.error(f"Erro ao limpar logs: {e}")
     
     async def _health_check(self):
         """Verifica a saúde de todos os componentes"""
+        if time.monotonic() < self._health_cache_exp:
+            return self._health_cache
+        
         try:
             health_status = {
                 "system": "healthy",
                 "components": {}
             }
             
-            # Verificar métricas
-            try:
-                self.metrics.get_system_metrics()
-                health_status["components"]["metrics"] = "healthy"
-            except Exception as e:
-                health_status["components"]["metrics"] = f"unhealthy: {e}"
-                health_status["system"] = "unhealthy"
-            
-            # Verificar cache
-            try:
-                self.cache.get("health_check")
-                health_status["components"]["cache"] = "healthy"
-            except Exception as e:
-                health_status["components"]["cache"] = f"unhealthy: {e}"
-                health_status["system"] = "unhealthy"
-            
-            # Verificar validador
-            try:
-                self.validator.validate_data({"test": "data"})
-                health_status["components"]["validator"] = "healthy"
-            except Exception as e:
-                health_status["components"]["validator"] = f"unhealthy: {e}"
-                health_status["system"] = "unhealthy"
-            
-            # Verificar sistema de alertas
-            if self.alert_manager:
+            # Probes só leem estado em memória: rodam direto no loop, sem threads
+            for name, probe in self._health_probes():
                 try:
-                    self.alert_manager.get_alert_stats()
-                    health_status["components"]["alerts"] = "healthy"
+                    probe()
+                    health_status["components"][name] = "healthy"
                 except Exception as e:
-                    health_status["components"]["alerts"] = f"unhealthy: {e}"
-                    health_status["system"] = "unhealthy"
-            
-            # Verificar detector de anomalias
-            if self.anomaly_detector:
-                try:
-                    self.anomaly_detector.get_anomaly_stats()
-                    health_status["components"]["ml"] = "healthy"
-                except Exception as e:
-                    health_status["components"]["ml"] = f"unhealthy: {e}"
-                    health_status["system"] = "unhealthy"
-            
-            # Verificar gerenciador de provedores
-            if self.data_provider_manager:
-                try:
-                    self.data_provider_manager.get_provider_status()
-                    health_status["components"]["providers"] = "healthy"
-                except Exception as e:
-                    health_status["components"]["providers"] = f"unhealthy: {e}"
+                    health_status["components"][name] = f"unhealthy: {e}"
                     health_status["system"] = "unhealthy"
             
             self.health_status = health_status["system"]
@@ -481,23 +688,48 @@ class CloudDataOrchestratorV2:
             if health_status["system"] == "healthy":
                 self.logger.info("✅ Health check: Todos os componentes saudáveis")
             else:
-                self.logger.warning(f"⚠️ Health check: Sistema com problemas - {health_status}")
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning("⚠️ Health check: Sistema com problemas - %r", health_status)
             
+            self._health_cache = health_status
+            self._health_cache_exp = time.monotonic() + self._health_ttl
             return health_status
             
         except Exception as e:
-            self.logger.error(f"Erro no health check: {e}")
+            self.logger.error("Erro no health check: %s", e)
             self.health_status = "error"
             return {"system": "error", "error": str(e)}
     
+    def _health_probes(self) -> List[tuple]:
+        """Tabela (nome, probe) dos componentes ativos"""
+        probe_table = (
+            ("metrics", self.metrics, lambda: self.metrics.get_system_metrics()),
+            ("cache", self.cache, lambda: self.cache.get("health_check")),
+            ("validator", self.validator, lambda: self.validator.validate_data({"test": "data"})),
+            ("alerts", self.alert_manager, lambda: self.alert_manager.get_alert_stats()),
+            ("ml", self.anomaly_detector, lambda: self.anomaly_detector.get_anomaly_stats()),
+            ("providers", self.data_provider_manager, lambda: self.data_provider_manager.get_provider_status())
+        )
+        return [(name, probe) for name, component, probe in probe_table if component is not None]
+    
+    def _uptime(self) -> Optional[str]:
+        """Uptime formatado (reaproveita a string enquanto o segundo não muda)"""
+        if self._start_mono_ns is None:
+            return None
+        
+        uptime_s = (time.monotonic_ns() - self._start_mono_ns) // 1_000_000_000
+        if self._uptime_str[0] != uptime_s:
+            self._uptime_str = (uptime_s, str(timedelta(seconds=uptime_s)))
+        return self._uptime_str[1]
+    
     def get_system_status(self) -> Dict[str, Any]:
         """Retorna status completo do sistema"""
         return {
-            "version": "2.0.0",
+            **_BASE_STATUS,
             "status": "running" if self.is_running else "stopped",
             "health": self.health_status,
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "uptime": str(datetime.now() - self.start_time) if self.start_time else None,
+            "start_time": self._start_iso,
+            "uptime": self._uptime(),
             "stats": self.stats,
             "components": {
                 "alerts": "enabled" if self.alert_manager else "disabled",
@@ -1,18 +1,138 @@
 import json
-import boto3
+import base64
 import logging
 from typing import Dict, Any, List
 from datetime import datetime
 import os
+import time
+from decimal import Decimal
+
+
+def _json_default(obj: Any) -> Any:
+    """Converte Decimal (números vindos do DynamoDB) em int/float"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    raise TypeError(f"Tipo não serializável: {type(obj).__name__}")
+
+
+# JSON: orjson quando empacotado com a função (C, UTF-8 nativo); stdlib como fallback
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=_json_default).decode()
+
+except ImportError:
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
 
 # Configuração de logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Inicialização do cliente DynamoDB
-dynamodb = boto3.resource("dynamodb")
+# Cliente DynamoDB de baixo nível e serializadores de tipos criados no primeiro
+# uso (reutilizados entre invocações no container quente)
 table_name = os.environ.get("DYNAMODB_TABLE", "data-pipeline-table")
-table = dynamodb.Table(table_name)
+_client = None
+_serializer = None
+_deserializer = None
+
+# GSI usado na listagem por tipo (hash: type, range: timestamp)
+TYPE_INDEX_NAME = os.environ.get("DYNAMODB_TYPE_INDEX", "TypeTimestampIndex")
+DEFAULT_PAGE_LIMIT = 50
+
+# Limite de itens por POST em lote (mantém a requisição abaixo dos 6MB do Lambda)
+MAX_BATCH_ITEMS = 500
+
+# BatchWriteItem aceita até 25 itens; itens não processados são reenviados
+BATCH_WRITE_SIZE = 25
+BATCH_WRITE_ATTEMPTS = 5
+
+# Cabeçalhos fixos das respostas (compartilhados entre invocações; dict comum
+# porque o runtime do Lambda serializa a resposta com json.dumps)
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+}
+
+# Alfabeto Crockford base32 usado pelos ULIDs
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _get_client():
+    """Retorna o cliente DynamoDB, importando boto3 só na primeira chamada"""
+    global _client
+    if _client is None:
+        import boto3
+        from botocore.config import Config
+
+        boto_config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"mode": "adaptive", "max_attempts": 5},
+            connect_timeout=1,
+            read_timeout=3,
+        )
+        _client = boto3.client("dynamodb", config=boto_config)
+    return _client
+
+
+def _get_serializers():
+    """Retorna (TypeSerializer, TypeDeserializer), independentes do cliente"""
+    global _serializer, _deserializer
+    if _serializer is None:
+        from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+        _deserializer = TypeDeserializer()
+        _serializer = TypeSerializer()
+    return _serializer, _deserializer
+
+
+def _to_decimal(value: Any) -> Any:
+    """Converte floats (não suportados pelo DynamoDB) em Decimal, recursivamente"""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _to_decimal(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_decimal(item) for item in value]
+    return value
+
+
+def to_dynamo(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte um dict Python para o formato tipado do DynamoDB"""
+    serializer = _get_serializers()[0]
+    return {key: serializer.serialize(_to_decimal(value)) for key, value in item.items()}
+
+
+def from_dynamo(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte um item tipado do DynamoDB para dict Python"""
+    deserializer = _get_serializers()[1]
+    return {key: deserializer.deserialize(value) for key, value in item.items()}
+
+
+def _prime_client() -> None:
+    """Cria o cliente e abre a conexão com o DynamoDB durante o init"""
+    try:
+        _get_client().describe_endpoints()
+    except Exception as e:
+        logger.warning(f"Falha ao pré-aquecer cliente DynamoDB: {str(e)}")
+
+
+# Com SnapStart ou concorrência provisionada o init roda antes das requisições
+# (e entra no snapshot): vale pagar import do boto3 e handshake TLS aqui
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") in ("snap-start", "provisioned-concurrency"):
+    _prime_client()
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -22,21 +142,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     try:
         # Extrair informações da requisição
         http_method = event.get("httpMethod", "GET")
-        path = event.get("path", "/")
-
-        logger.info(f"Requisição recebida: {http_method} {path}")
-
-        # Roteamento baseado no método HTTP
-        if http_method == "GET":
-            return handle_get(event)
-        elif http_method == "POST":
-            return handle_post(event)
-        elif http_method == "PUT":
-            return handle_put(event)
-        elif http_method == "DELETE":
-            return handle_delete(event)
-        else:
-            return create_response(405, {"error": "Método não permitido"})
+
+        logger.info("Requisição recebida: %s %s", http_method, event.get("path", "/"))
+
+        # Roteamento por tabela de métodos HTTP
+        return (_ROUTES.get(http_method) or _method_not_allowed)(event)
 
     except Exception as e:
         logger.error(f"Erro na execução: {str(e)}")
@@ -51,52 +161,115 @@ def handle_get(event: Dict[str, Any]) -> Dict[str, Any]:
 
         if "id" in query_params:
             # Buscar item específico por ID
-            response = table.get_item(Key={"id": query_params["id"]})
+            response = _get_client().get_item(
+                TableName=table_name, Key={"id": {"S": query_params["id"]}}
+            )
 
             if "Item" in response:
-                return create_response(200, response["Item"])
+                return create_response(200, from_dynamo(response["Item"]))
             else:
                 return create_response(404, {"error": "Item não encontrado"})
+
+        # Listagem paginada: Query no GSI por tipo (scan completo só com ?all=1)
+        limit = int(query_params.get("limit", DEFAULT_PAGE_LIMIT))
+        if limit < 1:
+            return create_response(400, {"error": "Parâmetros de paginação inválidos"})
+        start_key = decode_cursor(query_params["next"]) if "next" in query_params else None
+
+        if "type" in query_params:
+            items, last_key = query_type_page(query_params["type"], limit, start_key)
+        elif query_params.get("all") == "1":
+            items, last_key = scan_page(limit, start_key)
         else:
-            # Listar todos os itens (com paginação)
-            scan_kwargs = {}
-            if "limit" in query_params:
-                scan_kwargs["Limit"] = int(query_params["limit"])
+            return create_response(400, {"error": "Parâmetro obrigatório: type (ou id)"})
 
-            response = table.scan(**scan_kwargs)
-            items = response.get("Items", [])
+        result = {"items": items, "count": len(items)}
+        if last_key:
+            result["next"] = encode_cursor(last_key)
 
-            return create_response(200, {"items": items, "count": len(items)})
+        return create_response(200, result)
 
+    except ValueError:
+        return create_response(400, {"error": "Parâmetros de paginação inválidos"})
     except Exception as e:
         logger.error(f"Erro no GET: {str(e)}")
         return create_response(500, {"error": "Erro ao buscar dados"})
 
 
+def query_type_page(item_type: str, limit: int, start_key: Dict[str, Any] = None):
+    """Lista uma página de itens de um tipo via GSI
+
+    Retorna (itens, chave para continuar ou None).
+    """
+    client = _get_client()
+    params = {
+        "TableName": table_name,
+        "IndexName": TYPE_INDEX_NAME,
+        "KeyConditionExpression": "#type = :type",
+        "ExpressionAttributeNames": {"#type": "type"},
+        "ExpressionAttributeValues": {":type": {"S": item_type}},
+        "Limit": limit,
+    }
+    if start_key:
+        params["ExclusiveStartKey"] = to_dynamo(start_key)
+
+    response = client.query(**params)
+    items = [from_dynamo(item) for item in response.get("Items", [])]
+    last_key = response.get("LastEvaluatedKey")
+    return items, from_dynamo(last_key) if last_key else None
+
+
+def scan_page(limit: int, start_key: Dict[str, Any] = None):
+    """Varre a tabela página a página (até 100 itens por chamada) parando em limit
+
+    Retorna (itens, chave para continuar ou None). Só mantém em memória os
+    itens que serão devolvidos, independentemente do tamanho da tabela.
+    """
+    client = _get_client()
+    params = {"TableName": table_name}
+    if start_key:
+        params["ExclusiveStartKey"] = to_dynamo(start_key)
+
+    paginator = client.get_paginator("scan")
+    items = []
+    for page in paginator.paginate(**params, PaginationConfig={"PageSize": min(limit, 100)}):
+        for raw_item in page.get("Items", []):
+            items.append(from_dynamo(raw_item))
+            if len(items) >= limit:
+                # A tabela tem chave só em "id": o último item devolvido serve de cursor
+                return items, {"id": items[-1]["id"]}
+
+    return items, None
+
+
 def handle_post(event: Dict[str, Any]) -> Dict[str, Any]:
-    """Handler para requisições POST (criar novo item)"""
+    """Handler para requisições POST (criar um item ou um lote em body["items"])"""
     try:
         # Extrair corpo da requisição
-        body = json.loads(event.get("body", "{}"))
+        body = json_loads(event.get("body") or "{}")
+
+        # Apenas objeto (um item) ou lista (lote); número, string ou null é erro do cliente
+        if not isinstance(body, (dict, list)):
+            return create_response(400, {"error": "O corpo deve ser um objeto ou uma lista JSON"})
+
+        # Um único timestamp para todos os itens criados nesta requisição
+        now_iso = datetime.now().isoformat()
+
+        # Lote: lista direta ou {"items": [...]}
+        entries = body if isinstance(body, list) else body.get("items")
+        if isinstance(entries, list):
+            return handle_post_batch(entries, now_iso)
 
         # Validar dados obrigatórios
         if "type" not in body or "data" not in body:
             return create_response(400, {"error": "Campos obrigatórios: type, data"})
 
-        # Gerar ID único
-        item_id = f"{body['type']}_{datetime.now().isoformat()}"
-
         # Preparar item para DynamoDB
-        item = {
-            "id": item_id,
-            "type": body["type"],
-            "data": body["data"],
-            "timestamp": datetime.now().isoformat(),
-            "created_at": datetime.now().isoformat(),
-        }
+        item = build_item(body, now_iso)
+        item_id = item["id"]
 
         # Inserir no DynamoDB
-        table.put_item(Item=item)
+        _get_client().put_item(TableName=table_name, Item=to_dynamo(item))
 
         logger.info(f"Item criado com sucesso: {item_id}")
         return create_response(
@@ -110,47 +283,97 @@ def handle_post(event: Dict[str, Any]) -> Dict[str, Any]:
         return create_response(500, {"error": "Erro ao criar item"})
 
 
+def handle_post_batch(entries: List[Any], now_iso: str) -> Dict[str, Any]:
+    """Cria vários itens com BatchWriteItem"""
+    if not entries or len(entries) > MAX_BATCH_ITEMS:
+        return create_response(
+            400, {"error": f"items deve conter entre 1 e {MAX_BATCH_ITEMS} itens"}
+        )
+
+    if not all(isinstance(entry, dict) and "type" in entry and "data" in entry for entry in entries):
+        return create_response(400, {"error": "Campos obrigatórios em cada item: type, data"})
+
+    items = [build_item(entry, now_iso) for entry in entries]
+
+    batch_put(items)
+
+    item_ids = [item["id"] for item in items]
+    logger.info(f"{len(item_ids)} itens criados em lote")
+    return create_response(
+        201, {"message": "Itens criados com sucesso", "ids": item_ids, "count": len(item_ids)}
+    )
+
+
+def batch_put(items: List[Dict[str, Any]]) -> None:
+    """Grava itens em lotes de 25, reenviando UnprocessedItems com backoff"""
+    client = _get_client()
+    requests = [{"PutRequest": {"Item": to_dynamo(item)}} for item in items]
+
+    for start in range(0, len(requests), BATCH_WRITE_SIZE):
+        pending = {table_name: requests[start:start + BATCH_WRITE_SIZE]}
+        for attempt in range(BATCH_WRITE_ATTEMPTS):
+            response = client.batch_write_item(RequestItems=pending)
+            pending = response.get("UnprocessedItems") or {}
+            if not pending:
+                break
+            time.sleep(0.05 * 2 ** attempt)
+        else:
+            raise RuntimeError("Itens não processados pelo DynamoDB após reenvios")
+
+
+def build_item(entry: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
+    """Monta o item do DynamoDB com ID único (ULID) e timestamps"""
+    return {
+        "id": new_item_id(),
+        "type": entry["type"],
+        "data": entry["data"],
+        "timestamp": now_iso,
+        "created_at": now_iso,
+    }
+
+
 def handle_put(event: Dict[str, Any]) -> Dict[str, Any]:
     """Handler para requisições PUT (atualizar item existente)"""
     try:
         # Extrair corpo da requisição
-        body = json.loads(event.get("body", "{}"))
+        body = json_loads(event.get("body") or "{}")
 
         if "id" not in body:
             return create_response(400, {"error": "ID é obrigatório para atualização"})
 
-        # Verificar se o item existe
-        existing_item = table.get_item(Key={"id": body["id"]})
-        if "Item" not in existing_item:
-            return create_response(404, {"error": "Item não encontrado"})
-
-        # Preparar atualizações
-        update_expression = "SET "
+        # Preparar atualizações (placeholders de nomes e valores em dicts separados)
+        now_iso = datetime.now().isoformat()
         expression_values = {}
+        expression_names = {}
+        set_clauses = []
 
         for key, value in body.items():
-            if key != "id" and key != "created_at":
-                update_expression += f"#{key} = :{key}, "
-                expression_values[f":{key}"] = value
-                expression_values[f"#{key}"] = key
+            if key in ("id", "created_at", "updated_at"):
+                continue
+            expression_names[f"#{key}"] = key
+            expression_values[f":{key}"] = value
+            set_clauses.append(f"#{key} = :{key}")
 
         # Adicionar timestamp de atualização
-        update_expression += "#updated_at = :updated_at"
-        expression_values[":updated_at"] = datetime.now().isoformat()
-        expression_values["#updated_at"] = "updated_at"
-
-        # Remover vírgula extra
-        update_expression = update_expression.rstrip(", ")
-
-        # Atualizar no DynamoDB
-        table.update_item(
-            Key={"id": body["id"]},
-            UpdateExpression=update_expression,
-            ExpressionAttributeValues=expression_values,
-            ExpressionAttributeNames={
-                k: v for k, v in expression_values.items() if k.startswith("#")
-            },
-        )
+        expression_names["#updated_at"] = "updated_at"
+        expression_values[":updated_at"] = now_iso
+        set_clauses.append("#updated_at = :updated_at")
+
+        # Atualizar no DynamoDB (a condição garante que o item já existe)
+        expression_names["#id"] = "id"
+        client = _get_client()
+
+        try:
+            client.update_item(
+                TableName=table_name,
+                Key={"id": {"S": body["id"]}},
+                UpdateExpression="SET " + ", ".join(set_clauses),
+                ExpressionAttributeValues=to_dynamo(expression_values),
+                ExpressionAttributeNames=expression_names,
+                ConditionExpression="attribute_exists(#id)",
+            )
+        except client.exceptions.ConditionalCheckFailedException:
+            return create_response(404, {"error": "Item não encontrado"})
 
         logger.info(f"Item atualizado com sucesso: {body['id']}")
         return create_response(
@@ -173,14 +396,19 @@ def handle_delete(event: Dict[str, Any]) -> Dict[str, Any]:
         if "id" not in query_params:
             return create_response(400, {"error": "ID é obrigatório para exclusão"})
 
-        # Verificar se o item existe
-        existing_item = table.get_item(Key={"id": query_params["id"]})
-        if "Item" not in existing_item:
+        # Excluir do DynamoDB (a condição garante que o item existia)
+        client = _get_client()
+
+        try:
+            client.delete_item(
+                TableName=table_name,
+                Key={"id": {"S": query_params["id"]}},
+                ConditionExpression="attribute_exists(#id)",
+                ExpressionAttributeNames={"#id": "id"},
+            )
+        except client.exceptions.ConditionalCheckFailedException:
             return create_response(404, {"error": "Item não encontrado"})
 
-        # Excluir do DynamoDB
-        table.delete_item(Key={"id": query_params["id"]})
-
         logger.info(f"Item excluído com sucesso: {query_params['id']}")
         return create_response(
             200, {"message": "Item excluído com sucesso", "id": query_params["id"]}
@@ -191,15 +419,47 @@ def handle_delete(event: Dict[str, Any]) -> Dict[str, Any]:
         return create_response(500, {"error": "Erro ao excluir item"})
 
 
+def _method_not_allowed(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Resposta para métodos HTTP sem handler"""
+    return create_response(405, {"error": "Método não permitido"})
+
+
+# Tabela de roteamento (definida após os handlers)
+_ROUTES = {
+    "GET": handle_get,
+    "POST": handle_post,
+    "PUT": handle_put,
+    "DELETE": handle_delete,
+}
+
+
+def new_item_id() -> str:
+    """Gera um ULID: 48 bits de timestamp em ms + 80 bits aleatórios, em base32 (26 chars)
+
+    Ordenável lexicograficamente pelo tempo e bem distribuído entre partições.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    chars = []
+    for _ in range(26):
+        chars.append(_ULID_ALPHABET[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def encode_cursor(last_key: Dict[str, Any]) -> str:
+    """Codifica o LastEvaluatedKey do DynamoDB como cursor opaco"""
+    return base64.urlsafe_b64encode(json_dumps(last_key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decodifica o cursor recebido em ?next= para ExclusiveStartKey"""
+    return json_loads(base64.urlsafe_b64decode(cursor.encode()))
+
+
 def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Cria resposta padronizada para API Gateway"""
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Content-Type",
-            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-        },
-        "body": json.dumps(body, ensure_ascii=False),
+        "headers": _HEADERS,
+        "body": json_dumps(body),
     }
@@ -4,83 +4,148 @@ Script de Deploy para Funções Lambda
 Deploy automatizado das funções Lambda para AWS
 """
 
+import argparse
 import os
 import sys
 import zipfile
 import shutil
 import subprocess
-import json
+import base64
+import time
 from pathlib import Path
 
+try:
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+# Pacotes já fornecidos pelo runtime Python da AWS Lambda (não vão no ZIP)
+RUNTIME_PROVIDED_PACKAGES = ("boto3", "botocore", "s3transfer", "jmespath")
+
+# Limite de upload direto do ZIP na API da Lambda; acima disso só via S3
+DIRECT_UPLOAD_LIMIT = 50 * 1024 * 1024
+
+# Upload multipart para o S3: partes de 8MB enviadas em paralelo
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 10
+
+# Runtimes Python com suporte a SnapStart
+SNAPSTART_RUNTIMES = ("python3.12", "python3.13")
+
 class LambdaDeployer:
     """Deployer para funções Lambda"""
     
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose
         self.function_name = "data-pipeline-handler"
         self.region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
         self.zip_file = "data_handler.zip"
         self.lambda_dir = Path(__file__).parent
+        self.build_dir = self.lambda_dir / "build"
+        # URI do repositório ECR (ex.: 123456789012.dkr.ecr.us-east-1.amazonaws.com/data-handler);
+        # quando definido, o deploy usa imagem de container em vez do ZIP
+        self.image_repository = os.environ.get('LAMBDA_IMAGE_REPOSITORY')
+        # Alias publicado a cada deploy (SnapStart só vale para versões publicadas)
+        self.alias_name = os.environ.get('LAMBDA_ALIAS', 'live')
+        # Bucket S3 para staging do ZIP (obrigatório acima de 50MB)
+        self.artifact_bucket = os.environ.get('LAMBDA_ARTIFACT_BUCKET')
+        self.provisioned_concurrency = int(os.environ.get('LAMBDA_PROVISIONED_CONCURRENCY', '0'))
+        # Clientes boto3 criados sob demanda (uma sessão/credencial para todo o deploy)
+        self._clients = {}
         
-    def check_aws_cli(self):
-        """Verifica se AWS CLI está instalado"""
-        try:
-            result = subprocess.run(
-                ["aws", "--version"], 
-                capture_output=True, 
-                text=True
-            )
-            if result.returncode == 0:
-                print(f"✅ AWS CLI: {result.stdout.strip()}")
-                return True
-            else:
-                print("❌ AWS CLI não encontrado")
-                return False
-        except:
-            print("❌ AWS CLI não encontrado")
-            return False
+    def _client(self, service):
+        """Retorna o cliente boto3 do serviço, reutilizado entre chamadas"""
+        if service not in self._clients:
+            self._clients[service] = boto3.client(service, region_name=self.region)
+        return self._clients[service]
     
     def check_aws_credentials(self):
         """Verifica se as credenciais AWS estão configuradas"""
+        if not BOTO3_AVAILABLE:
+            print("❌ boto3 não instalado (pip install boto3)")
+            return False
+        
         try:
-            result = subprocess.run(
-                ["aws", "sts", "get-caller-identity"], 
-                capture_output=True, 
-                text=True
-            )
-            if result.returncode == 0:
-                identity = json.loads(result.stdout)
-                print(f"✅ AWS Credenciais: {identity.get('Account', 'N/A')}")
-                return True
-            else:
-                print("❌ AWS Credenciais não configuradas")
-                return False
-        except:
-            print("❌ Erro ao verificar credenciais AWS")
+            identity = self._client("sts").get_caller_identity()
+            print(f"✅ AWS Credenciais: {identity.get('Account', 'N/A')}")
+            return True
+        except (BotoCoreError, ClientError) as e:
+            print(f"❌ AWS Credenciais não configuradas: {e}")
             return False
     
+    def _is_runtime_provided(self, name):
+        """Verifica se o pacote/diretório já existe no runtime da Lambda"""
+        normalized = name.lower().replace("-", "_")
+        return any(normalized.startswith(pkg) for pkg in RUNTIME_PROVIDED_PACKAGES)
+    
     def install_dependencies(self):
-        """Instala dependências Python"""
+        """Instala dependências Python (exceto o SDK da AWS, provido pelo runtime)"""
         print("📦 Instalando dependências...")
         
         try:
-            # Instalar dependências
+            requirements = []
+            with open(self.lambda_dir / "requirements.txt") as f:
+                for line in f:
+                    line = line.split("#", 1)[0].strip()
+                    if line and not self._is_runtime_provided(line):
+                        requirements.append(line)
+            
+            if self.build_dir.exists():
+                shutil.rmtree(self.build_dir)
+            self.build_dir.mkdir()
+            
+            if not requirements:
+                print("✅ Nenhuma dependência extra para instalar")
+                return True
+            
+            # Instalar dependências no diretório de build
             result = subprocess.run(
-                ["pip", "install", "-r", "requirements.txt", "-t", "."],
+                ["pip", "install", *requirements, "-t", str(self.build_dir)],
                 capture_output=True,
                 text=True
             )
             
-            if result.returncode == 0:
-                print("✅ Dependências instaladas com sucesso")
-                return True
-            else:
+            if result.returncode != 0:
                 print(f"❌ Erro ao instalar dependências: {result.stderr}")
                 return False
+            
+            # Remover o SDK trazido como dependência transitiva
+            for item in self.build_dir.iterdir():
+                if self._is_runtime_provided(item.name):
+                    if item.is_dir():
+                        shutil.rmtree(item)
+                    else:
+                        item.unlink()
+            
+            print("✅ Dependências instaladas com sucesso (boto3/botocore do runtime)")
+            return True
                 
         except Exception as e:
             print(f"❌ Erro ao instalar dependências: {e}")
             return False
     
+    def _build_manifest(self):
+        """Lista (caminho, arcname) dos arquivos que entram no pacote"""
+        manifest = []
+        
+        # Código da função (sem este script)
+        for file_path in self.lambda_dir.glob("*.py"):
+            if file_path.name != "deploy.py":
+                manifest.append((file_path, file_path.relative_to(self.lambda_dir)))
+        
+        # Dependências instaladas no diretório de build
+        if self.build_dir.exists():
+            for file_path in self.build_dir.rglob("*"):
+                if not file_path.is_file():
+                    continue
+                arcname = file_path.relative_to(self.build_dir)
+                if "__pycache__" not in arcname.parts:
+                    manifest.append((file_path, arcname))
+        
+        return manifest
+    
     def create_zip_package(self):
         """Cria pacote ZIP para deploy"""
         print("🗜️  Criando pacote ZIP...")
@@ -91,25 +156,19 @@ class LambdaDeployer:
                 os.remove(self.zip_file)
                 print(f"🗑️  ZIP anterior removido: {self.zip_file}")
             
-            # Criar novo ZIP
-            with zipfile.ZipFile(self.zip_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Adicionar arquivos Python
-                for file_path in self.lambda_dir.rglob("*.py"):
-                    if file_path.name != "deploy.py":  # Não incluir este script
-                        arcname = file_path.relative_to(self.lambda_dir)
-                        zipf.write(file_path, arcname)
-                        print(f"📁 Adicionado: {arcname}")
-                
-                # Adicionar dependências instaladas
-                for item in self.lambda_dir.iterdir():
-                    if item.is_dir() and item.name not in ["__pycache__", ".git"]:
-                        if item.name.startswith("boto3") or item.name.startswith("botocore"):
-                            for file_path in item.rglob("*"):
-                                if file_path.is_file():
-                                    arcname = file_path.relative_to(self.lambda_dir)
-                                    zipf.write(file_path, arcname)
-                                    print(f"📦 Adicionado: {arcname}")
+            # Manifesto montado em uma única varredura; deflate nível 1 é
+            # várias vezes mais rápido que o padrão (6) com ~5% a mais de tamanho
+            manifest = self._build_manifest()
+            with zipfile.ZipFile(
+                self.zip_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as zipf:
+                for file_path, arcname in manifest:
+                    zipf.write(file_path, arcname)
             
+            if self.verbose:
+                # Listagem por arquivo só em modo verboso, em uma única escrita
+                sys.stdout.write("".join(f"📁 Adicionado: {arcname}\n" for _, arcname in manifest))
+            print(f"📁 {len(manifest)} arquivos adicionados")
             print(f"✅ Pacote ZIP criado: {self.zip_file}")
             return True
             
@@ -121,37 +180,202 @@ class LambdaDeployer:
         """Faz deploy para AWS Lambda"""
         print("☁️  Fazendo deploy para AWS Lambda...")
         
+        lambda_client = self._client("lambda")
+        
         try:
             # Verificar se a função existe
+            lambda_client.get_function(FunctionName=self.function_name)
+            print(f"✅ Função Lambda encontrada: {self.function_name}")
+        except lambda_client.exceptions.ResourceNotFoundException:
+            print(f"⚠️  Função Lambda não encontrada: {self.function_name}")
+            print("💡 Crie a função primeiro usando Terraform ou AWS Console")
+            return False
+        except (BotoCoreError, ClientError) as e:
+            print(f"❌ Erro ao fazer deploy: {e}")
+            return False
+        
+        try:
+            zip_size = os.path.getsize(self.zip_file)
+            
+            if self.artifact_bucket:
+                # Atualizar via S3 (upload multipart com várias conexões)
+                key = self._upload_artifact(zip_size)
+                lambda_client.update_function_code(
+                    FunctionName=self.function_name,
+                    S3Bucket=self.artifact_bucket,
+                    S3Key=key
+                )
+            elif zip_size > DIRECT_UPLOAD_LIMIT:
+                print(f"❌ ZIP com {zip_size / 1024 / 1024:.1f}MB excede o upload direto (50MB)")
+                print("💡 Defina LAMBDA_ARTIFACT_BUCKET para enviar via S3")
+                return False
+            else:
+                # Atualizar função existente
+                with open(self.zip_file, "rb") as f:
+                    lambda_client.update_function_code(
+                        FunctionName=self.function_name, ZipFile=f.read()
+                    )
+            
+            print("✅ Função Lambda atualizada com sucesso")
+            return True
+        except (BotoCoreError, ClientError, OSError) as e:
+            print(f"❌ Erro ao atualizar função: {e}")
+            return False
+    
+    def _upload_artifact(self, zip_size):
+        """Envia o ZIP para o bucket de artefatos e retorna a chave S3"""
+        from boto3.s3.transfer import TransferConfig
+        
+        transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=MULTIPART_CONCURRENCY,
+            use_threads=True
+        )
+        key = f"lambda/{self.function_name}/{self._image_tag()}/{self.zip_file}"
+        
+        print(f"📤 Enviando {zip_size / 1024 / 1024:.1f}MB para s3://{self.artifact_bucket}/{key}")
+        self._client("s3").upload_file(
+            self.zip_file, self.artifact_bucket, key, Config=transfer_config
+        )
+        return key
+    
+    def check_docker(self):
+        """Verifica se o Docker está disponível"""
+        try:
             result = subprocess.run(
-                ["aws", "lambda", "get-function", "--function-name", self.function_name, "--region", self.region],
+                ["docker", "version", "--format", "{{.Server.Version}}"],
                 capture_output=True,
                 text=True
             )
-            
             if result.returncode == 0:
-                print(f"✅ Função Lambda encontrada: {self.function_name}")
-                # Atualizar função existente
-                update_result = subprocess.run([
-                    "aws", "lambda", "update-function-code",
-                    "--function-name", self.function_name,
-                    "--zip-file", f"fileb://{self.zip_file}",
-                    "--region", self.region
-                ], capture_output=True, text=True)
-                
-                if update_result.returncode == 0:
-                    print("✅ Função Lambda atualizada com sucesso")
-                    return True
-                else:
-                    print(f"❌ Erro ao atualizar função: {update_result.stderr}")
-                    return False
-            else:
-                print(f"⚠️  Função Lambda não encontrada: {self.function_name}")
-                print("💡 Crie a função primeiro usando Terraform ou AWS Console")
+                print(f"✅ Docker: {result.stdout.strip()}")
+                return True
+            print("⚠️  Docker indisponível")
+            return False
+        except FileNotFoundError:
+            print("⚠️  Docker não encontrado")
+            return False
+    
+    def _image_tag(self):
+        """Tag do artefato: commit atual do git (ou timestamp fora de um repositório)"""
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=self.lambda_dir
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return time.strftime("%Y%m%d%H%M%S")
+    
+    def _run_step(self, description, command, **kwargs):
+        """Executa um passo do deploy, reportando falhas
+
+        Retorna a saída padrão do comando, ou None em caso de erro.
+        """
+        result = subprocess.run(command, capture_output=True, text=True, **kwargs)
+        if result.returncode != 0:
+            print(f"❌ Erro ao {description}: {result.stderr.strip()}")
+            return None
+        return result.stdout
+    
+    def deploy_image(self):
+        """Faz deploy via imagem de container (build, push no ECR e update da função)"""
+        print("🐳 Fazendo deploy via imagem de container...")
+        
+        image_uri = f"{self.image_repository}:{self._image_tag()}"
+        registry = self.image_repository.split("/", 1)[0]
+        
+        try:
+            # Login no ECR (token "AWS:<senha>" em base64)
+            auth = self._client("ecr").get_authorization_token()["authorizationData"][0]
+            password = base64.b64decode(auth["authorizationToken"]).decode().split(":", 1)[1]
+            if self._run_step(
+                "autenticar no ECR",
+                ["docker", "login", "--username", "AWS", "--password-stdin", registry],
+                input=password
+            ) is None:
                 return False
-                
+            
+            # Build: a camada de dependências é reaproveitada do cache do Docker
+            print(f"🔨 Build: {image_uri}")
+            if self._run_step(
+                "construir imagem",
+                ["docker", "build", "-t", image_uri, str(self.lambda_dir)]
+            ) is None:
+                return False
+            
+            print(f"📤 Push: {image_uri}")
+            if self._run_step("enviar imagem", ["docker", "push", image_uri]) is None:
+                return False
+            
+            self._client("lambda").update_function_code(
+                FunctionName=self.function_name, ImageUri=image_uri
+            )
+            
+            print(f"✅ Função Lambda atualizada com imagem: {image_uri}")
+            return True
+            
         except Exception as e:
-            print(f"❌ Erro ao fazer deploy: {e}")
+            print(f"❌ Erro no deploy da imagem: {e}")
+            return False
+    
+    def publish_live_alias(self):
+        """Publica versão com SnapStart (ou concorrência provisionada) e aponta o alias"""
+        print(f"🔖 Publicando versão e alias '{self.alias_name}'...")
+        
+        lambda_client = self._client("lambda")
+        waiter = lambda_client.get_waiter("function_updated")
+        
+        try:
+            waiter.wait(FunctionName=self.function_name)
+            
+            config = lambda_client.get_function_configuration(FunctionName=self.function_name)
+            runtime = config.get("Runtime")
+            
+            # SnapStart: o init (import do boto3, cliente, TLS) entra no snapshot
+            snap_start = runtime in SNAPSTART_RUNTIMES
+            if snap_start:
+                lambda_client.update_function_configuration(
+                    FunctionName=self.function_name,
+                    SnapStart={"ApplyOn": "PublishedVersions"}
+                )
+                waiter.wait(FunctionName=self.function_name)
+                print("⚡ SnapStart habilitado")
+            else:
+                print(f"⚠️  SnapStart indisponível para o runtime {runtime or 'de imagem'}")
+            
+            version = lambda_client.publish_version(FunctionName=self.function_name)["Version"]
+            
+            # Atualizar alias existente ou criá-lo no primeiro deploy
+            alias = {
+                "FunctionName": self.function_name,
+                "Name": self.alias_name,
+                "FunctionVersion": version,
+            }
+            try:
+                lambda_client.update_alias(**alias)
+            except lambda_client.exceptions.ResourceNotFoundException:
+                lambda_client.create_alias(**alias)
+            print(f"✅ Alias '{self.alias_name}' → versão {version}")
+            
+            # SnapStart e concorrência provisionada não se combinam na mesma versão
+            if self.provisioned_concurrency > 0:
+                if snap_start:
+                    print("⚠️  Concorrência provisionada ignorada (SnapStart ativo)")
+                else:
+                    lambda_client.put_provisioned_concurrency_config(
+                        FunctionName=self.function_name,
+                        Qualifier=self.alias_name,
+                        ProvisionedConcurrentExecutions=self.provisioned_concurrency
+                    )
+                    print(f"🔥 Concorrência provisionada: {self.provisioned_concurrency}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Erro ao publicar versão: {e}")
             return False
     
     def cleanup(self):
@@ -160,11 +384,9 @@ class LambdaDeployer:
         
         try:
             # Remover dependências instaladas
-            for item in self.lambda_dir.iterdir():
-                if item.is_dir() and item.name not in ["__pycache__", ".git"]:
-                    if item.name.startswith("boto3") or item.name.startswith("botocore"):
-                        shutil.rmtree(item)
-                        print(f"🗑️  Removido: {item.name}")
+            if self.build_dir.exists():
+                shutil.rmtree(self.build_dir)
+                print(f"🗑️  Removido: {self.build_dir.name}/")
             
             # Remover ZIP
             if os.path.exists(self.zip_file):
@@ -185,22 +407,25 @@ class LambdaDeployer:
         
         try:
             # Verificar pré-requisitos
-            if not self.check_aws_cli():
-                return False
-            
             if not self.check_aws_credentials():
                 return False
             
-            # Instalar dependências
-            if not self.install_dependencies():
-                return False
-            
-            # Criar pacote ZIP
-            if not self.create_zip_package():
-                return False
+            if self.image_repository and self.check_docker():
+                # Deploy via imagem de container
+                if not self.deploy_image():
+                    return False
+            else:
+                # Fallback: pacote ZIP
+                if not self.install_dependencies():
+                    return False
+                
+                if not self.create_zip_package():
+                    return False
+                
+                if not self.deploy_to_aws():
+                    return False
             
-            # Deploy para AWS
-            if not self.deploy_to_aws():
+            if not self.publish_live_alias():
                 return False
             
             print("=" * 50)
@@ -219,7 +444,13 @@ class LambdaDeployer:
 
 def main():
     """Função principal"""
-    deployer = LambdaDeployer()
+    parser = argparse.ArgumentParser(description="Deploy da função Lambda")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Lista cada arquivo adicionado ao pacote"
+    )
+    args = parser.parse_args()
+    
+    deployer = LambdaDeployer(verbose=args.verbose)
     
     try:
         success = deployer.deploy()
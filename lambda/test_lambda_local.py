@@ -1,9 +1,54 @@
-import json
 import os
-from data_handler import lambda_handler
 
-# Configurar variáveis de ambiente para teste
+# LAMBDA_TEST_LIVE=1 usa a tabela real; por padrão o cliente DynamoDB é
+# stubado com respostas prontas (sem rede nem credenciais)
+LIVE = os.environ.get("LAMBDA_TEST_LIVE") == "1"
+
+# Configurar variáveis de ambiente para teste (antes de importar o handler)
 os.environ["DYNAMODB_TABLE"] = "data-pipeline-table"
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+if not LIVE:
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+import data_handler
+from data_handler import json_dumps, lambda_handler
+
+SAMPLE_ID = "weather_2025-08-21T21:17:11.632706"
+SAMPLE_ITEM = {
+    "id": {"S": SAMPLE_ID},
+    "type": {"S": "weather"},
+    "data": {"M": {"city": {"S": "São Paulo"}, "temperature": {"N": "25.5"}}},
+}
+
+# Corpos serializados uma única vez (reutilizáveis em loops de carga)
+POST_BODY = json_dumps(
+    {
+        "type": "weather",
+        "data": {"city": "São Paulo", "temperature": 25.5, "humidity": 70},
+    }
+)
+PUT_BODY = json_dumps(
+    {
+        "id": SAMPLE_ID,
+        "type": "weather",
+        "data": {"city": "São Paulo", "temperature": 26.0, "humidity": 75},
+    }
+)
+
+
+def stub_client():
+    """Ativa um Stubber no cliente DynamoDB com as respostas, na ordem dos testes"""
+    from botocore.stub import Stubber
+
+    stubber = Stubber(data_handler._get_client())
+    stubber.add_response("query", {"Items": [SAMPLE_ITEM], "Count": 1})
+    stubber.add_response("put_item", {})
+    stubber.add_response("get_item", {"Item": SAMPLE_ITEM})
+    stubber.add_response("update_item", {})
+    stubber.add_response("delete_item", {})
+    stubber.activate()
+    return stubber
 
 
 def test_lambda_function():
@@ -11,9 +56,15 @@ def test_lambda_function():
 
     print("🧪 Testando função Lambda localmente...")
 
-    # Teste 1: GET sem parâmetros
-    print("\n1️⃣ Teste GET sem parâmetros:")
-    event_get = {"httpMethod": "GET", "path": "/data", "queryStringParameters": None}
+    stubber = None if LIVE else stub_client()
+
+    # Teste 1: GET listando por tipo
+    print("\n1️⃣ Teste GET listando por tipo:")
+    event_get = {
+        "httpMethod": "GET",
+        "path": "/data",
+        "queryStringParameters": {"type": "weather", "limit": "10"},
+    }
 
     try:
         response = get_response = lambda_handler(event_get, None)
@@ -27,12 +78,7 @@ def test_lambda_function():
     event_post = {
         "httpMethod": "POST",
         "path": "/data",
-        "body": json.dumps(
-            {
-                "type": "weather",
-                "data": {"city": "São Paulo", "temperature": 25.5, "humidity": 70},
-            }
-        ),
+        "body": POST_BODY,
     }
 
     try:
@@ -47,7 +93,7 @@ def test_lambda_function():
     event_get_id = {
         "httpMethod": "GET",
         "path": "/data",
-        "queryStringParameters": {"id": "weather_2025-08-21T21:17:11.632706"},
+        "queryStringParameters": {"id": SAMPLE_ID},
     }
 
     try:
@@ -62,13 +108,7 @@ def test_lambda_function():
     event_put = {
         "httpMethod": "PUT",
         "path": "/data",
-        "body": json.dumps(
-            {
-                "id": "weather_2025-08-21T21:17:11.632706",
-                "type": "weather",
-                "data": {"city": "São Paulo", "temperature": 26.0, "humidity": 75},
-            }
-        ),
+        "body": PUT_BODY,
     }
 
     try:
@@ -83,7 +123,7 @@ def test_lambda_function():
     event_delete = {
         "httpMethod": "DELETE",
         "path": "/data",
-        "queryStringParameters": {"id": "weather_2025-08-21T21:17:11.632706"},
+        "queryStringParameters": {"id": SAMPLE_ID},
     }
 
     try:
@@ -93,6 +133,10 @@ def test_lambda_function():
     except Exception as e:
         print(f"❌ Erro: {str(e)}")
 
+    if stubber is not None:
+        stubber.assert_no_pending_responses()
+        stubber.deactivate()
+
     print("\n✅ Testes concluídos!")
 
 
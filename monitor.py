@@ -4,46 +4,187 @@ Script de Monitoramento para Cloud Data Orchestrator
 Monitora o status de todos os componentes do projeto
 """
 
+import argparse
 import os
 import sys
 import json
 import time
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
+from io import StringIO
 from datetime import datetime
 from pathlib import Path
 
+# JSON do relatório: orjson (C) quando disponível, stdlib como fallback
+try:
+    import orjson
+    
+    def _dumps_report(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps_report(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Cache em disco dos resultados das verificações (entre execuções)
+CACHE_FILE = (
+    Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+    / 'clouddataorchestrator' / 'monitor.json'
+)
+
+# Arquivos obrigatórios do projeto
+REQUIRED_FILES = (
+    "README.md",
+    "requirements.txt",
+    "docker-compose.yml",
+    "deploy.py",
+    "monitor.py",
+    "run_tests.py",
+    ".github/workflows/ci-cd.yml",
+    "infrastructure/main.tf",
+    "lambda/data_handler.py",
+    "data_pipeline/data_collector.py",
+    "dashboard/app.py",
+    "tests/test_data_collector.py",
+)
+
+
+def _group_by_parent(paths):
+    """Agrupa caminhos relativos por diretório pai: {pai: frozenset(nomes)}"""
+    groups = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        groups.setdefault(parent, set()).add(name)
+    return {parent: frozenset(names) for parent, names in groups.items()}
+
+
+REQUIRED_BY_DIR = _group_by_parent(REQUIRED_FILES)
+
+# Tempo máximo (segundos) de cada probe: um comando travado não bloqueia o monitor
+PROBE_TIMEOUT = 5
+AWS_PROBE_TIMEOUT = 10
+
+# Validade (segundos) das entradas do cache por seção
+CACHE_TTL = {
+    'dependencies': 3600,
+    # Só a versão do AWS CLI; credenciais (podem expirar/ser revogadas) são sempre verificadas
+    'aws_cli': 86400,
+    'docker': 86400,
+    'git_remote': 86400,
+}
+
 class ProjectMonitor:
     """Monitor do projeto Cloud Data Orchestrator"""
     
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose
         self.project_root = Path(__file__).parent
         self.monitoring_data = {}
+        # Buffer de saída por thread: verificações paralelas não intercalam prints
+        self._local = threading.local()
+        # Cache de verificações (carregado uma vez por execução)
+        self._cache = {}
+        self._cache_dirty = False
+        self._cache_lock = threading.Lock()
+        
+    def _load_cache(self):
+        """Carrega o cache de verificações do disco"""
+        try:
+            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self):
+        """Grava o cache no disco (escrita atômica), se houve alteração"""
+        if not self._cache_dirty:
+            return
         
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = CACHE_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_file, CACHE_FILE)
+            self._cache_dirty = False
+        except OSError as e:
+            print(f"⚠️  Erro ao salvar cache de monitoramento: {e}")
+    
+    def _cache_get(self, section, key=None):
+        """Retorna a entrada do cache se ainda válida (dentro do TTL e com a mesma chave)"""
+        entry = self._cache.get(section)
+        if entry and entry.get('key') == key and time.time() - entry['ts'] < CACHE_TTL[section]:
+            return entry
+        return None
+    
+    def _cache_put(self, section, value, key=None):
+        """Registra um valor no cache"""
+        with self._cache_lock:
+            self._cache[section] = {'ts': time.time(), 'key': key, 'value': value}
+            self._cache_dirty = True
+    
+    def _file_key(self, path):
+        """Chave de invalidação baseada no caminho e mtime de um arquivo"""
+        try:
+            return f"{path}:{os.stat(path).st_mtime_ns}"
+        except OSError:
+            return f"{path}:missing"
+    
+    def _cached(self, section, check_func, key=None):
+        """Executa a verificação ou reaproveita o último resultado bem-sucedido"""
+        entry = self._cache_get(section, key)
+        if entry is not None:
+            self.monitoring_data[section] = entry['value']
+            self._print(f"♻️  Resultado em cache (há {int(time.time() - entry['ts'])}s)")
+            return True
+        
+        # Apenas sucessos são cacheados: falhas são sempre verificadas de novo
+        success = check_func()
+        if success and section in self.monitoring_data:
+            self._cache_put(section, self.monitoring_data[section], key)
+        return success
+    
+    def _print(self, *args):
+        """Imprime no buffer da verificação corrente (ou direto no stdout)"""
+        buffer = getattr(self._local, 'buffer', None)
+        print(*args, file=buffer)
+    
+    def _run_buffered(self, check_name, check_func):
+        """Executa uma verificação capturando sua saída; retorna o texto gerado"""
+        self._local.buffer = StringIO()
+        try:
+            check_func()
+        except Exception as e:
+            self._print(f"❌ Erro na verificação {check_name}: {e}")
+        finally:
+            output = self._local.buffer.getvalue()
+            self._local.buffer = None
+        return output
+    
     def check_file_structure(self):
         """Verifica a estrutura de arquivos do projeto"""
         print("📁 Verificando estrutura de arquivos...")
         
-        required_files = [
-            "README.md",
-            "requirements.txt",
-            "docker-compose.yml",
-            "deploy.py",
-            "monitor.py",
-            "run_tests.py",
-            ".github/workflows/ci-cd.yml",
-            "infrastructure/main.tf",
-            "lambda/data_handler.py",
-            "data_pipeline/data_collector.py",
-            "dashboard/app.py",
-            "tests/test_data_collector.py"
-        ]
-        
+        required_files = REQUIRED_FILES
         missing_files = []
         existing_files = []
         
+        # Uma listagem (scandir) por diretório em vez de um stat por arquivo
+        present = set()
+        for parent, names in REQUIRED_BY_DIR.items():
+            try:
+                with os.scandir(self.project_root / parent) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            present.add(f"{parent}/{entry.name}" if parent else entry.name)
+            except OSError:
+                # Diretório inexistente: todos os seus arquivos faltam
+                pass
+        
         for file_path in required_files:
-            full_path = self.project_root / file_path
-            if full_path.exists():
+            if file_path in present:
                 existing_files.append(file_path)
                 print(f"✅ {file_path}")
             else:
@@ -61,208 +202,295 @@ class ProjectMonitor:
         return len(missing_files) == 0
     
     def check_dependencies(self):
-        """Verifica dependências Python"""
-        print("\n📦 Verificando dependências...")
+        """Verifica dependências Python (metadados dos pacotes instalados, sem subprocess)"""
+        self._print("\n📦 Verificando dependências...")
         
         try:
-            result = subprocess.run(
-                ["pip", "list"], 
-                capture_output=True, 
-                text=True
-            )
+            required_packages = [
+                'boto3', 'requests', 'streamlit', 'plotly', 
+                'pandas', 'pytest', 'black', 'flake8'
+            ]
             
-            if result.returncode == 0:
-                installed_packages = result.stdout.lower()
-                
-                required_packages = [
-                    'boto3', 'requests', 'streamlit', 'plotly', 
-                    'pandas', 'pytest', 'black', 'flake8'
-                ]
-                
-                found_packages = []
-                missing_packages = []
-                
-                for package in required_packages:
-                    if package.lower() in installed_packages:
-                        found_packages.append(package)
-                        print(f"✅ {package}")
-                    else:
-                        missing_packages.append(package)
-                        print(f"❌ {package}")
-                
-                self.monitoring_data['dependencies'] = {
-                    'total_required': len(required_packages),
-                    'found': len(found_packages),
-                    'missing': len(missing_packages),
-                    'missing_packages': missing_packages,
-                    'coverage': f"{(len(found_packages)/len(required_packages))*100:.1f}%"
-                }
-                
-                return len(missing_packages) == 0
-            else:
-                print("❌ Erro ao verificar dependências")
-                return False
+            found_packages = []
+            missing_packages = []
+            
+            for package in required_packages:
+                try:
+                    distribution(package)
+                    found_packages.append(package)
+                    self._print(f"✅ {package}")
+                except PackageNotFoundError:
+                    missing_packages.append(package)
+                    self._print(f"❌ {package}")
+            
+            self.monitoring_data['dependencies'] = {
+                'total_required': len(required_packages),
+                'found': len(found_packages),
+                'missing': len(missing_packages),
+                'missing_packages': missing_packages,
+                'coverage': f"{(len(found_packages)/len(required_packages))*100:.1f}%"
+            }
+            
+            return len(missing_packages) == 0
                 
         except Exception as e:
-            print(f"❌ Erro ao verificar dependências: {e}")
+            self._print(f"❌ Erro ao verificar dependências: {e}")
             return False
     
     def check_git_status(self):
         """Verifica status do Git"""
-        print("\n🔧 Verificando status do Git...")
+        self._print("\n🔧 Verificando status do Git...")
         
         try:
             # Verificar se é um repositório Git
             if not (self.project_root / ".git").exists():
-                print("❌ Não é um repositório Git")
+                self._print("❌ Não é um repositório Git")
                 self.monitoring_data['git_status'] = {'is_repo': False}
                 return False
             
-            # Verificar status
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"], 
-                capture_output=True, 
-                text=True,
-                cwd=self.project_root
-            )
+            # Status, branch e upstream em uma única invocação do git; a saída é
+            # lida em streaming e o processo encerrado na primeira mudança
+            # (os cabeçalhos "# branch.*" vêm antes das entradas)
+            current_branch = "unknown"
+            upstream = None
+            has_changes = False
             
-            # Verificar branch atual
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"], 
-                capture_output=True, 
-                text=True,
-                cwd=self.project_root
-            )
+            timed_out = threading.Event()
             
-            # Verificar remote
-            remote_result = subprocess.run(
-                ["git", "remote", "-v"], 
-                capture_output=True, 
+            with subprocess.Popen(
+                ["git", "status", "--porcelain=v2", "--branch"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 cwd=self.project_root
-            )
+            ) as status_proc:
+                def on_timeout():
+                    timed_out.set()
+                    status_proc.kill()
+                
+                timer = threading.Timer(PROBE_TIMEOUT, on_timeout)
+                timer.start()
+                try:
+                    for line in status_proc.stdout:
+                        if line.startswith("# branch.head "):
+                            current_branch = line[len("# branch.head "):].rstrip("\n")
+                        elif line.startswith("# branch.upstream "):
+                            upstream = line[len("# branch.upstream "):].rstrip("\n")
+                        elif not line.startswith("#"):
+                            has_changes = True
+                            status_proc.kill()
+                            break
+                finally:
+                    timer.cancel()
+            
+            if timed_out.is_set() and not has_changes:
+                self._print(f"⏱️  git status excedeu {PROBE_TIMEOUT}s")
+                self.monitoring_data['git_status'] = {
+                    'is_repo': True,
+                    'available': False,
+                    'reason': 'timeout'
+                }
+                return False
             
-            current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
-            has_changes = len(status_result.stdout.strip()) > 0
-            remote_url = remote_result.stdout.strip() if remote_result.returncode == 0 else "none"
+            # URL do remote origin (cacheada até .git/config mudar)
+            config_key = self._file_key(self.project_root / ".git" / "config")
+            entry = self._cache_get('git_remote', config_key)
+            if entry is not None:
+                remote_url = entry['value']
+            else:
+                try:
+                    remote_result = subprocess.run(
+                        ["git", "config", "--get", "remote.origin.url"], 
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        cwd=self.project_root,
+                        timeout=PROBE_TIMEOUT
+                    )
+                    remote_url = (
+                        self._first_line(remote_result.stdout)
+                        if remote_result.returncode == 0 else "none"
+                    )
+                    self._cache_put('git_remote', remote_url, config_key)
+                except subprocess.TimeoutExpired:
+                    remote_url = "none"
+            
+            has_remote = remote_url != "none"
             
-            print(f"✅ Branch atual: {current_branch}")
-            print(f"✅ Mudanças pendentes: {'Sim' if has_changes else 'Não'}")
-            print(f"✅ Remote configurado: {'Sim' if 'origin' in remote_url else 'Não'}")
+            self._print(f"✅ Branch atual: {current_branch}")
+            self._print(f"✅ Mudanças pendentes: {'Sim' if has_changes else 'Não'}")
+            self._print(f"✅ Remote configurado: {'Sim' if has_remote else 'Não'}")
             
             self.monitoring_data['git_status'] = {
                 'is_repo': True,
                 'current_branch': current_branch,
                 'has_changes': has_changes,
-                'remote_url': remote_url
+                'remote_url': remote_url,
+                'upstream': upstream
             }
             
             return True
             
         except Exception as e:
-            print(f"❌ Erro ao verificar Git: {e}")
+            self._print(f"❌ Erro ao verificar Git: {e}")
             return False
     
     def check_aws_config(self):
-        """Verifica configuração AWS"""
-        print("\n☁️  Verificando configuração AWS...")
+        """Verifica configuração AWS (credenciais via boto3, sem subprocess)"""
+        self._print("\n☁️  Verificando configuração AWS...")
         
         try:
-            # Verificar AWS CLI
-            aws_version_result = subprocess.run(
-                ["aws", "--version"], 
-                capture_output=True, 
-                text=True
-            )
+            # AWS CLI: apenas uma busca no PATH
+            aws_cli = shutil.which("aws")
+            cli_installed = aws_cli is not None
+            if cli_installed:
+                self._print(f"✅ AWS CLI: {self._aws_cli_version(aws_cli)}")
+            else:
+                self._print("⚠️  AWS CLI não instalado")
             
-            if aws_version_result.returncode == 0:
-                print(f"✅ AWS CLI: {aws_version_result.stdout.strip()}")
-                
-                # Verificar credenciais
-                identity_result = subprocess.run(
-                    ["aws", "sts", "get-caller-identity"], 
-                    capture_output=True, 
-                    text=True
+            # Verificar credenciais
+            try:
+                import boto3
+                from botocore.config import Config
+                from botocore.exceptions import (
+                    BotoCoreError, ClientError, ConnectTimeoutError, ReadTimeoutError
                 )
-                
-                if identity_result.returncode == 0:
-                    identity = json.loads(identity_result.stdout)
-                    print(f"✅ AWS Account: {identity.get('Account', 'N/A')}")
-                    print(f"✅ AWS User: {identity.get('Arn', 'N/A')}")
-                    
-                    self.monitoring_data['aws_config'] = {
-                        'cli_installed': True,
-                        'credentials_configured': True,
-                        'account_id': identity.get('Account'),
-                        'user_arn': identity.get('Arn')
-                    }
-                    
-                    return True
-                else:
-                    print("❌ AWS Credenciais não configuradas")
-                    self.monitoring_data['aws_config'] = {
-                        'cli_installed': True,
-                        'credentials_configured': False
-                    }
-                    return False
-            else:
-                print("❌ AWS CLI não instalado")
+            except ImportError:
+                self._print("❌ boto3 não instalado")
                 self.monitoring_data['aws_config'] = {
-                    'cli_installed': False,
+                    'cli_installed': cli_installed,
                     'credentials_configured': False
                 }
                 return False
-                
+            
+            try:
+                sts_config = Config(
+                    connect_timeout=AWS_PROBE_TIMEOUT / 2,
+                    read_timeout=AWS_PROBE_TIMEOUT / 2,
+                    retries={'total_max_attempts': 1}
+                )
+                identity = boto3.client("sts", config=sts_config).get_caller_identity()
+            except (ConnectTimeoutError, ReadTimeoutError):
+                # Timeout de rede não significa credenciais ausentes
+                self._print(f"⏱️  AWS STS excedeu {AWS_PROBE_TIMEOUT}s")
+                self.monitoring_data['aws_config'] = {
+                    'cli_installed': cli_installed,
+                    'credentials_configured': False,
+                    'available': False,
+                    'reason': 'timeout'
+                }
+                return False
+            except (BotoCoreError, ClientError):
+                self._print("❌ AWS Credenciais não configuradas")
+                self.monitoring_data['aws_config'] = {
+                    'cli_installed': cli_installed,
+                    'credentials_configured': False
+                }
+                return False
+            
+            self._print(f"✅ AWS Account: {identity.get('Account', 'N/A')}")
+            self._print(f"✅ AWS User: {identity.get('Arn', 'N/A')}")
+            
+            self.monitoring_data['aws_config'] = {
+                'cli_installed': cli_installed,
+                'credentials_configured': True,
+                'account_id': identity.get('Account'),
+                'user_arn': identity.get('Arn')
+            }
+            
+            return True
+        
+        except subprocess.TimeoutExpired as e:
+            # `aws --version` (modo verboso) travado
+            self._print(f"⏱️  {e.cmd[0]} excedeu {PROBE_TIMEOUT}s")
+            self.monitoring_data['aws_config'] = {
+                'cli_installed': True,
+                'credentials_configured': False,
+                'available': False,
+                'reason': 'timeout'
+            }
+            return False
         except Exception as e:
-            print(f"❌ Erro ao verificar AWS: {e}")
+            self._print(f"❌ Erro ao verificar AWS: {e}")
             return False
     
+    def _aws_cli_version(self, aws_cli):
+        """Versão do AWS CLI, cacheada por caminho do executável (muda raramente)"""
+        if not self.verbose:
+            return aws_cli
+        
+        entry = self._cache_get('aws_cli', aws_cli)
+        if entry is not None:
+            return entry['value']
+        
+        version = self._tool_version(aws_cli)
+        if version != aws_cli:
+            self._cache_put('aws_cli', version, aws_cli)
+        return version
+    
+    @staticmethod
+    def _first_line(output):
+        """Decodifica apenas a primeira linha da saída (bytes) de um comando"""
+        return output.split(b"\n", 1)[0].decode(errors="replace").strip()
+    
+    def _tool_version(self, path):
+        """Versão de um executável (só no modo verboso: exige um processo)"""
+        if not self.verbose:
+            return path
+        result = subprocess.run(
+            [path, "--version"], 
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=PROBE_TIMEOUT
+        )
+        return self._first_line(result.stdout) if result.returncode == 0 else path
+    
     def check_docker(self):
-        """Verifica Docker"""
-        print("\n🐳 Verificando Docker...")
+        """Verifica Docker (presença no PATH; versão apenas com --verbose)"""
+        self._print("\n🐳 Verificando Docker...")
+        
+        # Presença vem do PATH; só a consulta de versão (--verbose) pode expirar
+        docker_path = shutil.which("docker")
+        compose_path = shutil.which("docker-compose") if docker_path else None
         
         try:
             # Verificar Docker
-            docker_version_result = subprocess.run(
-                ["docker", "--version"], 
-                capture_output=True, 
-                text=True
-            )
-            
-            if docker_version_result.returncode == 0:
-                print(f"✅ Docker: {docker_version_result.stdout.strip()}")
+            if docker_path:
+                self._print(f"✅ Docker: {self._tool_version(docker_path)}")
                 
                 # Verificar Docker Compose
-                compose_version_result = subprocess.run(
-                    ["docker-compose", "--version"], 
-                    capture_output=True, 
-                    text=True
-                )
-                
-                if compose_version_result.returncode == 0:
-                    print(f"✅ Docker Compose: {compose_version_result.stdout.strip()}")
+                if compose_path:
+                    self._print(f"✅ Docker Compose: {self._tool_version(compose_path)}")
                     self.monitoring_data['docker'] = {
                         'docker_installed': True,
                         'compose_installed': True
                     }
                     return True
                 else:
-                    print("❌ Docker Compose não instalado")
+                    self._print("❌ Docker Compose não instalado")
                     self.monitoring_data['docker'] = {
                         'docker_installed': True,
                         'compose_installed': False
                     }
                     return False
             else:
-                print("❌ Docker não instalado")
+                self._print("❌ Docker não instalado")
                 self.monitoring_data['docker'] = {
                     'docker_installed': False,
                     'compose_installed': False
                 }
                 return False
                 
+        except subprocess.TimeoutExpired as e:
+            self._print(f"⏱️  {e.cmd[0]} excedeu {PROBE_TIMEOUT}s")
+            self.monitoring_data['docker'] = {
+                'docker_installed': docker_path is not None,
+                'compose_installed': compose_path is not None,
+                'available': False,
+                'reason': 'timeout'
+            }
+            return False
         except Exception as e:
-            print(f"❌ Erro ao verificar Docker: {e}")
+            self._print(f"❌ Erro ao verificar Docker: {e}")
             return False
     
     def generate_report(self):
@@ -294,14 +522,13 @@ class ProjectMonitor:
         
         # AWS
         aws = self.monitoring_data.get('aws_config', {})
-        if aws.get('cli_installed'):
-            print(f"\n☁️  AWS: ✅ CLI instalado")
-            if aws.get('credentials_configured'):
-                print(f"   Account: {aws.get('account_id', 'N/A')}")
-            else:
-                print(f"   Credenciais: ❌ Não configuradas")
+        print(f"\n☁️  AWS: {'✅ CLI instalado' if aws.get('cli_installed') else '❌ CLI não instalado'}")
+        if aws.get('credentials_configured'):
+            print(f"   Account: {aws.get('account_id', 'N/A')}")
+        elif aws.get('reason') == 'timeout':
+            print(f"   Credenciais: ⏱️  Verificação excedeu o tempo limite")
         else:
-            print(f"\n☁️  AWS: ❌ CLI não instalado")
+            print(f"   Credenciais: ❌ Não configuradas")
         
         # Docker
         docker = self.monitoring_data.get('docker', {})
@@ -317,9 +544,11 @@ class ProjectMonitor:
         print("=" * 60)
         
         # Salvar relatório em arquivo
+        # (escrita atômica: arquivo temporário + rename)
         report_file = self.project_root / "monitoring_report.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(self.monitoring_data, f, indent=2, ensure_ascii=False)
+        tmp_file = report_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(_dumps_report(self.monitoring_data))
+        os.replace(tmp_file, report_file)
         
         print(f"📄 Relatório salvo em: {report_file}")
     
@@ -330,21 +559,37 @@ class ProjectMonitor:
         
         start_time = time.time()
         
-        # Executar todas as verificações
+        # Estrutura de arquivos: I/O local, executada antes das demais
+        print(f"\n{'='*20} Estrutura de Arquivos {'='*20}")
+        try:
+            self.check_file_structure()
+        except Exception as e:
+            print(f"❌ Erro na verificação Estrutura de Arquivos: {e}")
+        
+        # Verificações dominadas por subprocessos rodam em paralelo; a saída
+        # de cada uma é impressa inteira, na ordem original
+        self._cache = self._load_cache()
+        requirements_key = self._file_key(self.project_root / "requirements.txt")
+        
         checks = [
-            ("Estrutura de Arquivos", self.check_file_structure),
-            ("Dependências Python", self.check_dependencies),
+            ("Dependências Python", lambda: self._cached(
+                'dependencies', self.check_dependencies, requirements_key
+            )),
             ("Status Git", self.check_git_status),
             ("Configuração AWS", self.check_aws_config),
-            ("Docker", self.check_docker)
+            ("Docker", lambda: self._cached('docker', self.check_docker))
         ]
         
-        for check_name, check_func in checks:
-            print(f"\n{'='*20} {check_name} {'='*20}")
-            try:
-                check_func()
-            except Exception as e:
-                print(f"❌ Erro na verificação {check_name}: {e}")
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                (check_name, executor.submit(self._run_buffered, check_name, check_func))
+                for check_name, check_func in checks
+            ]
+            for check_name, future in futures:
+                print(f"\n{'='*20} {check_name} {'='*20}")
+                print(future.result(), end="")
+        
+        self._save_cache()
         
         end_time = time.time()
         execution_time = end_time - start_time
@@ -358,7 +603,13 @@ class ProjectMonitor:
 
 def main():
     """Função principal"""
-    monitor = ProjectMonitor()
+    parser = argparse.ArgumentParser(description="Monitoramento do Cloud Data Orchestrator")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Exibe as versões de docker/aws (executa cada CLI)"
+    )
+    args = parser.parse_args()
+    
+    monitor = ProjectMonitor(verbose=args.verbose)
     
     try:
         success = monitor.run_monitoring()
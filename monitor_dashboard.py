@@ -4,62 +4,119 @@ Dashboard de Monitoramento para Cloud Data Orchestrator
 Interface simples para visualizar status e métricas do sistema
 """
 
+import heapq
 import os
 import sys
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# Leitura de teclas sem bloquear o refresh: select + cbreak (POSIX) ou msvcrt (Windows)
+try:
+    import select
+    import termios
+    import tty
+    MSVCRT_AVAILABLE = False
+except ImportError:
+    import msvcrt
+    MSVCRT_AVAILABLE = True
+
+# Limpar tela e posicionar o cursor no topo (sequência ANSI, sem subprocesso)
+CLEAR = "\x1b[2J\x1b[H"
+
+# Paletas de status (padrão: ⚠️ para saúde, ❓ para circuit breakers)
+_HEALTH_EMOJI = {'healthy': '✅', 'error': '❌'}
+_CB_EMOJI = {'closed': '🟢', 'open': '🔴', 'half_open': '🟡'}
 
 # Adicionar diretório raiz ao path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from integrated_system import IntegratedSystem
-
 class MonitorDashboard:
     """Dashboard de monitoramento do sistema"""
     
     def __init__(self):
+        # Import tardio: o sistema integrado carrega dependências pesadas
+        from integrated_system import IntegratedSystem
+        
         self.system = IntegratedSystem()
         self.refresh_interval = 5  # segundos
+        self._cbreak = False  # terminal em modo cbreak (tecla sem Enter)
+        self._frame = []  # linhas do quadro atual, escritas de uma vez
+    
+    def _out(self, line: str = ""):
+        """Acrescenta uma linha ao quadro em construção"""
+        self._frame.append(line)
+    
+    def _wait_for_key(self, timeout: float) -> Optional[str]:
+        """Aguarda uma tecla por até timeout segundos; retorna a tecla ou None"""
+        if MSVCRT_AVAILABLE:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if msvcrt.kbhit():
+                    return msvcrt.getwch()
+                time.sleep(0.1)
+            return None
+        
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if not ready:
+            return None
+        
+        if self._cbreak:
+            return os.read(sys.stdin.fileno(), 1).decode(errors="ignore")
+        
+        # stdin sem terminal: uma ação por linha; EOF encerra o dashboard
+        line = sys.stdin.readline()
+        return line.strip() if line else "4"
+    
+    def _get_system_status(self) -> Optional[Dict[str, Any]]:
+        """Obtém o status do sistema para o quadro atual (None em caso de erro)"""
+        try:
+            return self.system.get_system_status()
+        except Exception as e:
+            self._out(f"\n❌ Erro ao obter status do sistema: {e}")
+            return None
     
     def display_header(self):
         """Exibe cabeçalho do dashboard"""
-        print("\n" + "=" * 80)
-        print("🚀 CLOUD DATA ORCHESTRATOR - DASHBOARD DE MONITORAMENTO")
-        print("=" * 80)
-        print(f"📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-        print(f"🔄 Atualização automática a cada {self.refresh_interval} segundos")
-        print("=" * 80)
+        self._out("\n" + "=" * 80)
+        self._out("🚀 CLOUD DATA ORCHESTRATOR - DASHBOARD DE MONITORAMENTO")
+        self._out("=" * 80)
+        self._out(f"📅 Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
+        self._out(f"🔄 Atualização automática a cada {self.refresh_interval} segundos")
+        self._out("=" * 80)
     
     def display_health_status(self):
         """Exibe status de saúde do sistema"""
-        print("\n🏥 STATUS DE SAÚDE DO SISTEMA")
-        print("-" * 50)
+        self._out("\n🏥 STATUS DE SAÚDE DO SISTEMA")
+        self._out("-" * 50)
         
         try:
             health_status = self.system.run_health_check()
             overall_status = health_status['status']
             
             # Emoji baseado no status
-            status_emoji = "✅" if overall_status == "healthy" else "❌" if overall_status == "error" else "⚠️"
+            status_emoji = _HEALTH_EMOJI.get(overall_status, "⚠️")
             
-            print(f"{status_emoji} Status Geral: {overall_status.upper()}")
+            self._out(f"{status_emoji} Status Geral: {overall_status.upper()}")
             
             # Detalhes dos health checks
             for check_name, check_result in health_status['checks'].items():
                 check_emoji = "✅" if check_result['status'] else "❌"
-                print(f"  {check_emoji} {check_name}: {'Saudável' if check_result['status'] else 'Problema'}")
+                self._out(f"  {check_emoji} {check_name}: {'Saudável' if check_result['status'] else 'Problema'}")
                 
         except Exception as e:
-            print(f"❌ Erro ao verificar saúde: {e}")
+            self._out(f"❌ Erro ao verificar saúde: {e}")
     
-    def display_metrics_summary(self):
+    def display_metrics_summary(self, system_status: Optional[Dict[str, Any]]):
         """Exibe resumo das métricas"""
-        print("\n📊 RESUMO DE MÉTRICAS")
-        print("-" * 50)
+        self._out("\n📊 RESUMO DE MÉTRICAS")
+        self._out("-" * 50)
+        
+        if system_status is None:
+            self._out("⚠️ Status do sistema indisponível")
+            return
         
         try:
-            system_status = self.system.get_system_status()
             metrics = system_status['metrics']
             
             # Contar métricas por tipo
@@ -68,71 +125,73 @@ class MonitorDashboard:
                 metric_type = metric.get('type', 'unknown')
                 metric_counts[metric_type] = metric_counts.get(metric_type, 0) + 1
             
-            print(f"📈 Total de métricas: {len(metrics)}")
+            self._out(f"📈 Total de métricas: {len(metrics)}")
             for metric_type, count in metric_counts.items():
-                print(f"  • {metric_type}: {count}")
+                self._out(f"  • {metric_type}: {count}")
             
             # Cache stats
             cache_stats = system_status['cache_stats']
-            print(f"\n💾 CACHE:")
-            print(f"  • Hits: {cache_stats['hits']}")
-            print(f"  • Misses: {cache_stats['misses']}")
-            print(f"  • Taxa de acerto: {cache_stats['hit_rate']}%")
-            print(f"  • Tamanho atual: {cache_stats['size']}/{cache_stats['max_size']}")
+            self._out(f"\n💾 CACHE:")
+            self._out(f"  • Hits: {cache_stats['hits']}")
+            self._out(f"  • Misses: {cache_stats['misses']}")
+            self._out(f"  • Taxa de acerto: {cache_stats['hit_rate']}%")
+            self._out(f"  • Tamanho atual: {cache_stats['size']}/{cache_stats['max_size']}")
             
         except Exception as e:
-            print(f"❌ Erro ao obter métricas: {e}")
+            self._out(f"❌ Erro ao obter métricas: {e}")
     
-    def display_resilience_status(self):
+    def display_resilience_status(self, system_status: Optional[Dict[str, Any]]):
         """Exibe status dos componentes de resiliência"""
-        print("\n🛡️ STATUS DE RESILIÊNCIA")
-        print("-" * 50)
+        self._out("\n🛡️ STATUS DE RESILIÊNCIA")
+        self._out("-" * 50)
+        
+        if system_status is None:
+            self._out("⚠️ Status do sistema indisponível")
+            return
         
         try:
-            system_status = self.system.get_system_status()
             resilience_status = system_status['resilience_status']
             
             # Circuit breakers
-            print("🔌 CIRCUIT BREAKERS:")
+            self._out("🔌 CIRCUIT BREAKERS:")
             for name, cb_status in resilience_status['circuit_breakers'].items():
-                state_emoji = {
-                    'closed': '🟢',
-                    'open': '🔴',
-                    'half_open': '🟡'
-                }.get(cb_status['state'], '❓')
+                state_emoji = _CB_EMOJI.get(cb_status['state'], '❓')
                 
-                print(f"  {state_emoji} {name}: {cb_status['state']}")
-                print(f"    • Falhas: {cb_status['failure_count']}/{cb_status['failure_threshold']}")
-                print(f"    • Sucessos: {cb_status['success_count']}")
+                self._out(f"  {state_emoji} {name}: {cb_status['state']}")
+                self._out(f"    • Falhas: {cb_status['failure_count']}/{cb_status['failure_threshold']}")
+                self._out(f"    • Sucessos: {cb_status['success_count']}")
             
             # Retry handlers
-            print("\n🔄 RETRY HANDLERS:")
+            self._out("\n🔄 RETRY HANDLERS:")
             for name, rh_status in resilience_status['retry_handlers'].items():
-                print(f"  • {name}: {rh_status['max_attempts']} tentativas máximas")
+                self._out(f"  • {name}: {rh_status['max_attempts']} tentativas máximas")
             
         except Exception as e:
-            print(f"❌ Erro ao obter status de resiliência: {e}")
+            self._out(f"❌ Erro ao obter status de resiliência: {e}")
     
-    def display_config_summary(self):
+    def display_config_summary(self, system_status: Optional[Dict[str, Any]]):
         """Exibe resumo das configurações"""
-        print("\n⚙️ CONFIGURAÇÕES DO SISTEMA")
-        print("-" * 50)
+        self._out("\n⚙️ CONFIGURAÇÕES DO SISTEMA")
+        self._out("-" * 50)
+        
+        if system_status is None:
+            self._out("⚠️ Status do sistema indisponível")
+            return
         
         try:
-            system_status = self.system.get_system_status()
             config_summary = system_status['config_summary']
             
-            print(f"🌍 Região AWS: {config_summary['aws_region']}")
-            print(f"🏗️ Ambiente: {config_summary['environment']}")
-            print(f"🐛 Debug Mode: {'Ativado' if config_summary['debug_mode'] else 'Desativado'}")
+            self._out(f"🌍 Região AWS: {config_summary['aws_region']}")
+            self._out(f"🏗️ Ambiente: {config_summary['environment']}")
+            self._out(f"🐛 Debug Mode: {'Ativado' if config_summary['debug_mode'] else 'Desativado'}")
             
         except Exception as e:
-            print(f"❌ Erro ao obter configurações: {e}")
+            self._out(f"❌ Erro ao obter configurações: {e}")
     
     def display_recent_activity(self):
         """Exibe atividade recente"""
-        print("\n🕒 ATIVIDADE RECENTE")
-        print("-" * 50)
+        self._out("\n🕒 ATIVIDADE RECENTE")
+        self._out("-" * 50)
         
         try:
             # Verificar dados em cache
@@ -140,27 +199,27 @@ class MonitorDashboard:
             recent_keys = [key for key in cache.keys() if key.startswith('data_')]
             
             if recent_keys:
-                print(f"📦 Dados recentes em cache: {len(recent_keys)} tipos")
-                for key in sorted(recent_keys, reverse=True)[:3]:  # Últimos 3
+                self._out(f"📦 Dados recentes em cache: {len(recent_keys)} tipos")
+                for key in heapq.nlargest(3, recent_keys):  # Últimos 3, sem ordenar tudo
                     data = cache.get(key)
                     if data and isinstance(data, dict):
                         count = data.get('count', 0)
-                        print(f"  • {key}: {count} registros")
+                        self._out(f"  • {key}: {count} registros")
             else:
-                print("📭 Nenhum dado recente encontrado")
+                self._out("📭 Nenhum dado recente encontrado")
                 
         except Exception as e:
-            print(f"❌ Erro ao verificar atividade: {e}")
+            self._out(f"❌ Erro ao verificar atividade: {e}")
     
     def display_actions_menu(self):
         """Exibe menu de ações disponíveis"""
-        print("\n🎯 AÇÕES DISPONÍVEIS")
-        print("-" * 50)
-        print("1. 🔄 Executar pipeline de coleta")
-        print("2. 🧹 Executar manutenção")
-        print("3. 📊 Atualizar dashboard")
-        print("4. 🚪 Sair")
-        print("-" * 50)
+        self._out("\n🎯 AÇÕES DISPONÍVEIS")
+        self._out("-" * 50)
+        self._out("1. 🔄 Executar pipeline de coleta")
+        self._out("2. 🧹 Executar manutenção")
+        self._out("3. 📊 Atualizar dashboard")
+        self._out("4. 🚪 Sair")
+        self._out("-" * 50)
     
     def execute_action(self, action: str):
         """Executa ação selecionada"""
@@ -196,32 +255,55 @@ class MonitorDashboard:
     
     def run_dashboard(self):
         """Executa o dashboard principal"""
+        # Windows 10+: habilita o processamento de sequências ANSI no console
+        if os.name == 'nt':
+            os.system('')
+        
+        # Modo cbreak: teclas chegam sem Enter (configuração restaurada ao sair)
+        saved_attrs = None
+        if not MSVCRT_AVAILABLE and sys.stdin.isatty():
+            saved_attrs = termios.tcgetattr(sys.stdin)
+            tty.setcbreak(sys.stdin.fileno())
+            self._cbreak = True
+        
+        try:
+            self._dashboard_loop()
+        finally:
+            if saved_attrs is not None:
+                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, saved_attrs)
+                self._cbreak = False
+    
+    def _dashboard_loop(self):
+        """Redesenha a cada refresh_interval ou imediatamente ao receber uma tecla"""
         while True:
             try:
-                # Limpar tela (Windows)
-                os.system('cls' if os.name == 'nt' else 'clear')
-                
-                # Exibir dashboard
+                # Montar o quadro em memória (a limpeza de tela vai na mesma escrita)
+                self._frame = []
                 self.display_header()
                 self.display_health_status()
-                self.display_metrics_summary()
-                self.display_resilience_status()
-                self.display_config_summary()
+                
+                # Status do sistema obtido uma única vez por quadro
+                system_status = self._get_system_status()
+                self.display_metrics_summary(system_status)
+                self.display_resilience_status(system_status)
+                self.display_config_summary(system_status)
                 self.display_recent_activity()
                 self.display_actions_menu()
                 
-                # Aguardar input do usuário
-                try:
-                    action = input("\n🎯 Escolha uma ação (1-4): ").strip()
-                    self.execute_action(action)
-                except KeyboardInterrupt:
-                    print("\n\n👋 Dashboard interrompido pelo usuário")
-                    break
+                # Aguardar tecla do usuário (ou o próximo refresh)
+                self._out("\n🎯 Escolha uma ação (1-4): ")
+                sys.stdout.write(CLEAR + "\n".join(self._frame))
+                sys.stdout.flush()
+                action = self._wait_for_key(self.refresh_interval)
+                if action is None:
+                    continue
+                
+                self.execute_action(action)
                 
-                # Aguardar antes da próxima atualização
-                if action != "3":  # Se não for atualizar, aguardar
-                    print(f"\n⏳ Aguardando {self.refresh_interval} segundos...")
-                    time.sleep(self.refresh_interval)
+                # Tempo para ler o resultado; qualquer tecla antecipa o refresh
+                if action != "3":
+                    print(f"\n⏳ Atualizando em {self.refresh_interval} segundos (qualquer tecla para continuar)...")
+                    self._wait_for_key(self.refresh_interval)
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Dashboard interrompido pelo usuário")
@@ -5,42 +5,60 @@ Script para executar a API REST do CloudDataOrchestrator v2.0
 
 import os
 import sys
-import uvicorn
+from importlib.util import find_spec
 from pathlib import Path
 
+# Event loop e parser HTTP em C quando disponíveis (uvloop não existe no Windows);
+# find_spec só localiza os módulos, sem importá-los
+LOOP_IMPL = "uvloop" if find_spec("uvloop") else "asyncio"
+HTTP_IMPL = "httptools" if find_spec("httptools") else "h11"
+
 def main():
     """Função principal para executar a API"""
+    import uvicorn
     
     # Configurar variáveis de ambiente
     os.environ.setdefault("API_TOKEN", "clouddataorchestrator-api-key")
     os.environ.setdefault("LOG_LEVEL", "INFO")
     
-    # Configurações da API
+    # Configurações da API (ambiente lido uma única vez)
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
     reload = os.getenv("API_RELOAD", "true").lower() == "true"
     workers = int(os.getenv("API_WORKERS", "1"))
+    log_level = os.getenv("LOG_LEVEL", "info").lower()
+    access_log = os.getenv("API_ACCESS_LOG", "true").lower() == "true"
+    
+    # Com reload o uvicorn roda um único processo e ignora workers
+    effective_workers = 1 if reload else workers
+    
+    uvicorn_kwargs = {
+        "host": host,
+        "port": port,
+        "reload": reload,
+        "workers": effective_workers,
+        "log_level": log_level,
+        "access_log": access_log,
+        "use_colors": True,
+        "loop": LOOP_IMPL,
+        "http": HTTP_IMPL,
+    }
     
     print("🚀 Iniciando CloudDataOrchestrator API v2.0")
     print(f"📡 Host: {host}")
     print(f"🔌 Porta: {port}")
     print(f"🔄 Reload: {reload}")
-    print(f"👥 Workers: {workers}")
+    if effective_workers != workers:
+        print(f"👥 Workers: {effective_workers} (API_WORKERS={workers} ignorado com reload)")
+    else:
+        print(f"👥 Workers: {effective_workers}")
+    print(f"⚡ Loop/HTTP: {LOOP_IMPL}/{HTTP_IMPL}")
     print(f"🔑 Token: {os.getenv('API_TOKEN')}")
     print("=" * 50)
     
     # Executar API
     try:
-        uvicorn.run(
-            "api.main:app",
-            host=host,
-            port=port,
-            reload=reload,
-            workers=workers if not reload else 1,
-            log_level=os.getenv("LOG_LEVEL", "info").lower(),
-            access_log=True,
-            use_colors=True
-        )
+        uvicorn.run("api.main:app", **uvicorn_kwargs)
     except KeyboardInterrupt:
         print("\n🛑 API interrompida pelo usuário")
     except Exception as e:
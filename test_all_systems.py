@@ -4,8 +4,12 @@ Script de Teste Completo para Cloud Data Orchestrator
 Testa todos os sistemas implementados
 """
 
+import asyncio
+import io
 import os
 import sys
+import tempfile
+import threading
 import time
 from datetime import datetime
 
@@ -141,12 +145,14 @@ def test_cache_system():
         print(f"✅ Operações básicas testadas: {value}")
         
         # Testar cache persistente
-        persistent_cache = PersistentCache(cache_dir="cache", max_size=10, default_ttl=30)
-        print("✅ PersistentCache criado com sucesso")
-        
-        persistent_cache.set("persistent_key", {"data": "teste"})
-        persistent_value = persistent_cache.get("persistent_key")
-        print(f"✅ Cache persistente testado: {persistent_value}")
+        # Diretório próprio: o Sistema Integrado, em paralelo, grava cache/cache_data.pkl
+        with tempfile.TemporaryDirectory() as cache_dir:
+            persistent_cache = PersistentCache(cache_dir=cache_dir, max_size=10, default_ttl=30)
+            print("✅ PersistentCache criado com sucesso")
+            
+            persistent_cache.set("persistent_key", {"data": "teste"})
+            persistent_value = persistent_cache.get("persistent_key")
+            print(f"✅ Cache persistente testado: {persistent_value}")
         
         # Testar decorator
         @CacheDecorator(memory_cache, ttl=60)
@@ -313,7 +319,47 @@ def test_integrated_system():
         print(f"❌ Erro no sistema integrado: {e}")
         return False
 
-def main():
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout que direciona a saída de cada thread de teste para seu próprio buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        """Inicia a captura da thread atual"""
+        self._local.buffer = io.StringIO()
+    
+    def release(self):
+        """Encerra a captura da thread atual e retorna o texto capturado"""
+        buffer, self._local.buffer = self._local.buffer, None
+        return buffer.getvalue()
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def _run_test(test_func, output):
+    """Executa um teste (em thread) capturando sua saída; retorna (resultado, saída)"""
+    output.capture()
+    start_time = time.time()
+    
+    try:
+        success = test_func()
+        duration = time.time() - start_time
+        result = {"status": "PASS" if success else "FAIL", "duration": duration}
+    except Exception as e:
+        duration = time.time() - start_time
+        result = {"status": "ERROR", "duration": duration, "error": str(e)}
+    
+    return result, output.release()
+
+
+async def main():
     """Função principal"""
     print("🚀 INICIANDO TESTES COMPLETOS DO SISTEMA")
     print("=" * 60)
@@ -330,31 +376,41 @@ def main():
         ("Sistema Integrado", test_integrated_system)
     ]
     
-    # Executar testes
+    # Executar testes em paralelo (independentes, dominados por I/O e sleeps);
+    # a saída de cada um é exibida inteira, na ordem da lista
     results = {}
     total_tests = len(tests)
     passed_tests = 0
     
-    for test_name, test_func in tests:
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_run_test, test_func, output) for _, test_func in tests),
+            return_exceptions=True
+        )
+    finally:
+        sys.stdout = output._stream
+    
+    for (test_name, _), outcome in zip(tests, outcomes):
         print(f"\n🔄 Executando: {test_name}")
-        start_time = time.time()
         
-        try:
-            success = test_func()
-            duration = time.time() - start_time
-            
-            if success:
-                results[test_name] = {"status": "PASS", "duration": duration}
-                passed_tests += 1
-                print(f"✅ {test_name}: PASS ({duration:.2f}s)")
-            else:
-                results[test_name] = {"status": "FAIL", "duration": duration}
-                print(f"❌ {test_name}: FAIL ({duration:.2f}s)")
-                
-        except Exception as e:
-            duration = time.time() - start_time
-            results[test_name] = {"status": "ERROR", "duration": duration, "error": str(e)}
-            print(f"💥 {test_name}: ERROR ({duration:.2f}s) - {e}")
+        if isinstance(outcome, BaseException):
+            result = {"status": "ERROR", "duration": 0.0, "error": str(outcome)}
+        else:
+            result, text = outcome
+            print(text, end="")
+        
+        results[test_name] = result
+        duration = result["duration"]
+        
+        if result["status"] == "PASS":
+            passed_tests += 1
+            print(f"✅ {test_name}: PASS ({duration:.2f}s)")
+        elif result["status"] == "FAIL":
+            print(f"❌ {test_name}: FAIL ({duration:.2f}s)")
+        else:
+            print(f"💥 {test_name}: ERROR ({duration:.2f}s) - {result['error']}")
     
     # Resumo final
     print("\n" + "=" * 60)
@@ -378,5 +434,5 @@ def main():
 
 if __name__ == "__main__":
     import random
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
@@ -17,7 +17,7 @@ class TestDataCollector:
         assert collector.cities == ["São Paulo", "Rio de Janeiro", "Brasília"]
         assert collector.table_name == "data-pipeline-table"
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_collect_weather_data_success(self, mock_get, collector):
         """Testa coleta bem-sucedida de dados de clima"""
         # Mock da resposta da API
@@ -39,7 +39,7 @@ class TestDataCollector:
         assert result[0]["temperature"] == 25.5
         assert result[0]["humidity"] == 70
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_collect_weather_data_no_api_key(self, mock_get, collector):
         """Testa coleta sem API key configurada"""
         collector.openweather_api_key = None
@@ -49,7 +49,7 @@ class TestDataCollector:
         assert result == []
         mock_get.assert_not_called()
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_collect_currency_data_success(self, mock_get, collector):
         """Testa coleta bem-sucedida de dados de câmbio"""
         mock_response = mock.Mock()
@@ -66,7 +66,7 @@ class TestDataCollector:
         assert result[0]["target_currency"] == "EUR"
         assert result[0]["rate"] == 0.85
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_collect_currency_data_api_error(self, mock_get, collector):
         """Testa erro na API de câmbio"""
         mock_response = mock.Mock()
@@ -84,10 +84,12 @@ class TestDataCollector:
             {"city": "Rio de Janeiro", "temp": 30},
         ]
 
-        with mock.patch.object(collector.table, "put_item") as mock_put:
+        with mock.patch.object(collector.table, "batch_writer") as mock_writer:
             collector.save_to_dynamodb(test_data, "weather")
 
-            # Verifica se put_item foi chamado 2 vezes
+            # Verifica se um único batch_writer foi aberto para todos os itens
+            mock_writer.assert_called_once()
+            mock_put = mock_writer.return_value.__enter__.return_value.put_item
             assert mock_put.call_count == 2
 
             # Verifica se os dados foram passados corretamente
@@ -6,13 +6,46 @@ Cache em memória com TTL e persistência
 
 import os
 import json
+import math
 import time
 import pickle
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 from collections import OrderedDict
 
+# JSON: orjson quando disponível (serializa dict/list em bytes sem string temporária)
+try:
+    import orjson
+    
+    def _jdumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    
+    _jloads = orjson.loads
+except ImportError:
+    def _jdumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+    
+    _jloads = json.loads
+
+class _JsonBlob(bytes):
+    """Valor dict/list já serializado em JSON para o cache persistente"""
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _json_native(value: Any) -> bool:
+    """True se o valor volta idêntico do JSON (tipos exatos, chaves str, floats finitos)"""
+    kind = type(value)
+    if kind is dict:
+        return all(type(k) is str and _json_native(v) for k, v in value.items())
+    if kind is list:
+        return all(_json_native(v) for v in value)
+    if kind is float:
+        return math.isfinite(value)
+    # type() exato: subclasses (IntEnum, str Enum...) voltariam como o tipo base
+    return kind in _JSON_SCALARS
+
 class CacheItem:
     """Item individual do cache"""
     
@@ -41,12 +74,14 @@ class CacheItem:
         }
 
 class MemoryCache:
-    """Cache em memória com TTL"""
+    """Cache em memória com TTL (seguro para uso a partir de várias threads)"""
     
     def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.cache: OrderedDict[str, CacheItem] = OrderedDict()
+        # Protege o OrderedDict: até get() o altera (move_to_end)
+        self._lock = threading.RLock()
         self.stats = {
             "hits": 0,
             "misses": 0,
@@ -60,80 +95,98 @@ class MemoryCache:
         if ttl is None:
             ttl = self.default_ttl
         
-        # Remover item existente se houver
-        if key in self.cache:
-            del self.cache[key]
-        
-        # Verificar se cache está cheio
-        if len(self.cache) >= self.max_size:
-            # Remover item mais antigo
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-        
-        # Adicionar novo item
-        self.cache[key] = CacheItem(key, value, ttl)
-        self.cache.move_to_end(key)  # Mover para o final (mais recente)
-        
-        self.stats["sets"] += 1
+        with self._lock:
+            # Remover item existente se houver
+            if key in self.cache:
+                del self.cache[key]
+            
+            # Verificar se cache está cheio
+            if len(self.cache) >= self.max_size:
+                # Remover item mais antigo
+                oldest_key = next(iter(self.cache))
+                del self.cache[oldest_key]
+            
+            # Adicionar novo item
+            self.cache[key] = CacheItem(key, value, ttl)
+            self.cache.move_to_end(key)  # Mover para o final (mais recente)
+            
+            self.stats["sets"] += 1
     
     def get(self, key: str, default: Any = None) -> Any:
         """Obtém um valor do cache"""
-        if key not in self.cache:
-            self.stats["misses"] += 1
-            return default
-        
-        item = self.cache[key]
-        
-        # Verificar se expirou
-        if item.is_expired():
-            del self.cache[key]
-            self.stats["expirations"] += 1
-            self.stats["misses"] += 1
-            return default
-        
-        # Mover para o final (mais recente)
-        self.cache.move_to_end(key)
-        self.stats["hits"] += 1
-        
-        return item.value
+        with self._lock:
+            if key not in self.cache:
+                self.stats["misses"] += 1
+                return default
+            
+            item = self.cache[key]
+            
+            # Verificar se expirou
+            if item.is_expired():
+                del self.cache[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return default
+            
+            # Mover para o final (mais recente)
+            self.cache.move_to_end(key)
+            self.stats["hits"] += 1
+            
+            return item.value
     
     def delete(self, key: str) -> bool:
         """Remove um item do cache"""
-        if key in self.cache:
-            del self.cache[key]
-            self.stats["deletes"] += 1
-            return True
-        return False
+        with self._lock:
+            if key in self.cache:
+                del self.cache[key]
+                self.stats["deletes"] += 1
+                return True
+            return False
     
     def clear(self) -> None:
         """Limpa todo o cache"""
-        self.cache.clear()
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "sets": 0,
-            "deletes": 0,
-            "expirations": 0
-        }
+        with self._lock:
+            self.cache.clear()
+            self.stats = {
+                "hits": 0,
+                "misses": 0,
+                "sets": 0,
+                "deletes": 0,
+                "expirations": 0
+            }
     
     def cleanup_expired(self) -> int:
         """Remove itens expirados"""
-        expired_keys = [key for key, item in self.cache.items() if item.is_expired()]
-        
-        for key in expired_keys:
-            del self.cache[key]
-            self.stats["expirations"] += 1
-        
-        return len(expired_keys)
+        with self._lock:
+            expired_keys = [key for key, item in self.cache.items() if item.is_expired()]
+            
+            for key in expired_keys:
+                del self.cache[key]
+                self.stats["expirations"] += 1
+            
+            return len(expired_keys)
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Cópia serializável dos itens válidos, tirada sob o lock"""
+        with self._lock:
+            return {
+                key: item.to_dict()
+                for key, item in self.cache.items()
+                if not item.is_expired()
+            }
     
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas do cache"""
-        total_requests = self.stats["hits"] + self.stats["misses"]
-        hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
+        with self._lock:
+            stats = dict(self.stats)
+            size = len(self.cache)
+        
+        total_requests = stats["hits"] + stats["misses"]
+        hit_rate = (stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         
         return {
-            **self.stats,
-            "size": len(self.cache),
+            **stats,
+            "size": size,
             "max_size": self.max_size,
             "hit_rate": round(hit_rate, 2),
             "total_requests": total_requests
@@ -141,19 +194,21 @@ class MemoryCache:
     
     def keys(self) -> list:
         """Retorna todas as chaves válidas (não expiradas)"""
-        self.cleanup_expired()
-        return list(self.cache.keys())
+        with self._lock:
+            self.cleanup_expired()
+            return list(self.cache.keys())
     
     def exists(self, key: str) -> bool:
         """Verifica se uma chave existe e não expirou"""
-        if key not in self.cache:
-            return False
-        
-        if self.cache[key].is_expired():
-            del self.cache[key]
-            return False
-        
-        return True
+        with self._lock:
+            if key not in self.cache:
+                return False
+            
+            if self.cache[key].is_expired():
+                del self.cache[key]
+                return False
+            
+            return True
 
 class PersistentCache:
     """Cache com persistência em disco"""
@@ -164,6 +219,7 @@ class PersistentCache:
         
         self.memory_cache = MemoryCache(max_size, default_ttl)
         self.persistent_file = self.cache_dir / "cache_data.pkl"
+        self._save_lock = threading.Lock()
         
         # Carregar cache persistente
         self._load_persistent_cache()
@@ -198,15 +254,15 @@ class PersistentCache:
     def _save_persistent_cache(self) -> None:
         """Salva cache no disco"""
         try:
-            # Converter para formato serializável
-            persistent_data = {}
-            for key, item in self.memory_cache.cache.items():
-                if not item.is_expired():
-                    persistent_data[key] = item.to_dict()
+            # Snapshot sob o lock do cache em memória; a gravação usa só a cópia
+            persistent_data = self.memory_cache.snapshot()
             
-            # Salvar no disco
-            with open(self.persistent_file, 'wb') as f:
-                pickle.dump(persistent_data, f)
+            # Uma gravação por vez; arquivo temporário + os.replace evita arquivo parcial
+            with self._save_lock:
+                tmp_file = self.persistent_file.with_suffix(".tmp")
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump(persistent_data, f)
+                os.replace(tmp_file, self.persistent_file)
             
         except Exception as e:
             print(f"⚠️  Erro ao salvar cache persistente: {e}")
@@ -216,6 +272,12 @@ class PersistentCache:
         self.memory_cache.set(key, value, ttl)
         self._save_persistent_cache()
     
+    def set_many(self, items) -> None:
+        """Define vários valores (key, value, ttl) gravando o disco uma única vez"""
+        for key, value, ttl in items:
+            self.memory_cache.set(key, value, ttl)
+        self._save_persistent_cache()
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Obtém um valor do cache"""
         return self.memory_cache.get(key, default)
@@ -232,13 +294,17 @@ class PersistentCache:
         self.memory_cache.clear()
         self._save_persistent_cache()
     
-    def cleanup_expired(self) -> int:
-        """Remove itens expirados"""
+    def cleanup_expired(self, persist: bool = True) -> int:
+        """Remove itens expirados (persist=False deixa a gravação para save())"""
         count = self.memory_cache.cleanup_expired()
-        if count > 0:
+        if count > 0 and persist:
             self._save_persistent_cache()
         return count
     
+    def save(self) -> None:
+        """Grava o estado atual no disco"""
+        self._save_persistent_cache()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas do cache"""
         return self.memory_cache.get_stats()
@@ -292,12 +358,38 @@ class Cache:
             return value
         
         # Tentar persistente
-        return self.persistent_cache.get(key, default)
+        value = self.persistent_cache.get(key, default)
+        if isinstance(value, _JsonBlob):
+            return _jloads(bytes(value))
+        return value
     
     def set(self, key: str, value: Any, ttl: int = None):
         """Define valor no cache"""
         self.memory_cache.set(key, value, ttl)
-        self.persistent_cache.set(key, value, ttl)
+        self.persistent_cache.set(key, self._persistable(value), ttl)
+    
+    def set_many(self, items):
+        """Define vários valores (key, value, ttl) com uma única gravação em disco"""
+        items = list(items)
+        for key, value, ttl in items:
+            self.memory_cache.set(key, value, ttl)
+        self.persistent_cache.set_many(
+            (key, self._persistable(value), ttl) for key, value, ttl in items
+        )
+    
+    @staticmethod
+    def _persistable(value: Any) -> Any:
+        """dict/list vão para o disco como um único blob JSON (pickle de bytes é trivial)
+
+        Só quando o valor é JSON puro; tuplas, chaves não-str, datetime etc. seguem no
+        pickle para que a leitura devolva os mesmos tipos da camada em memória.
+        """
+        if type(value) in (dict, list) and _json_native(value):
+            try:
+                return _JsonBlob(_jdumps(value))
+            except (TypeError, ValueError):
+                pass
+        return value
     
     def delete(self, key: str):
         """Remove valor do cache"""
@@ -309,6 +401,20 @@ class Cache:
         self.memory_cache.clear()
         self.persistent_cache.clear()
     
+    def cleanup(self, persist: bool = True) -> int:
+        """Remove itens expirados (regrava o arquivo persistente se necessário)
+
+        Com persist=False só a parte em memória é feita; quem chama grava com save().
+        """
+        return (
+            self.memory_cache.cleanup_expired()
+            + self.persistent_cache.cleanup_expired(persist=persist)
+        )
+    
+    def save(self) -> None:
+        """Grava o cache persistente no disco"""
+        self.persistent_cache.save()
+    
     def get_stats(self):
         """Retorna estatísticas do cache"""
         return {
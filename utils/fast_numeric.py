@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Rotinas numéricas aceleradas para Cloud Data Orchestrator
+Preparação de séries antes da detecção de anomalias (Numba quando disponível)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit("float64[:](float64[:])", cache=True, error_model="numpy")
+    def _prepare_values_jit(values):
+        """Compacta a série removendo valores não finitos em uma única passada"""
+        out = np.empty(values.shape[0], dtype=np.float64)
+        count = 0
+        for i in range(values.shape[0]):
+            value = values[i]
+            if np.isfinite(value):
+                out[count] = value
+                count += 1
+        return out[:count]
+
+
+def prepare_values(values) -> np.ndarray:
+    """Prepara valores para o detector de anomalias
+
+    Converte para ndarray float64 contíguo e remove NaN/inf.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        return _prepare_values_jit(values)
+
+    return values[np.isfinite(values)]
@@ -69,6 +69,20 @@ class MetricsCollector:
         )
         self.metrics[name].append(metric_point)
     
+    def record_counters(self, counters: Dict[str, int], tags: Optional[Dict[str, str]] = None) -> None:
+        """Registra vários contadores de uma vez"""
+        if tags is None:
+            tags = {}
+        
+        timestamp = datetime.now()
+        for name, value in counters.items():
+            self.counters[name] += value
+            self.metrics[name].append(MetricPoint(
+                timestamp=timestamp,
+                value=float(value),
+                tags=tags
+            ))
+    
     def record_timer(self, name: str, duration: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Registra um timer"""
         if tags is None: